@@ -7,7 +7,7 @@ Makes the Backrooms feel physically real.
 
 import math
 import numpy as np
-from config import PILLAR_SPACING, WALL_THICKNESS, HALLWAY_WIDTH, PILLAR_SIZE
+from config import PILLAR_SPACING
 
 
 class CollisionSystem:
@@ -56,8 +56,9 @@ class CollisionSystem:
             
             # Check for any remaining collisions and resolve
             resolved = False
+            resolve_segment = self._resolve_segment_collision
             for segment in segments:
-                result = self._resolve_segment_collision(final_x, final_z, segment)
+                result = resolve_segment(final_x, final_z, segment)
                 if result:
                     final_x, final_z = result
                     collided = True
@@ -73,9 +74,10 @@ class CollisionSystem:
         """Quick check if currently penetrating any geometry."""
         segments = self._get_nearby_segments(x, z)
         threshold = self.player_radius + self.skin_width
+        distance_to_segment = self._distance_to_segment
         
         for segment in segments:
-            dist = self._distance_to_segment(x, z, segment)
+            dist = distance_to_segment(x, z, segment)
             if dist < threshold:
                 return True
         return False
@@ -177,6 +179,8 @@ class CollisionSystem:
         push_x = 0
         push_z = 0
         push_count = 0
+        player_radius = self.player_radius
+        sqrt = math.sqrt
         
         for segment in segments:
             seg_x1, seg_z1, seg_x2, seg_z2 = segment
@@ -184,7 +188,7 @@ class CollisionSystem:
             # Segment vector
             seg_dx = seg_x2 - seg_x1
             seg_dz = seg_z2 - seg_z1
-            seg_len = math.sqrt(seg_dx*seg_dx + seg_dz*seg_dz)
+            seg_len = sqrt(seg_dx*seg_dx + seg_dz*seg_dz)
             
             if seg_len < 0.001:
                 continue
@@ -207,11 +211,11 @@ class CollisionSystem:
             # Distance
             dist_x = x - closest_x
             dist_z = z - closest_z
-            dist = math.sqrt(dist_x*dist_x + dist_z*dist_z)
+            dist = sqrt(dist_x*dist_x + dist_z*dist_z)
             
             # If penetrating, push out
-            if dist < self.player_radius:
-                penetration = self.player_radius - dist
+            if dist < player_radius:
+                penetration = player_radius - dist
                 
                 # Determine side
                 if dist > 0.001:
@@ -243,121 +247,18 @@ class CollisionSystem:
         Returns list of (x1, z1, x2, z2) tuples.
         """
         segments = []
-        half_thick = WALL_THICKNESS / 2
+        extend = segments.extend
+        # Per-cell segments are built and cached by the world
+        collision_segments = self.world.collision_segments
         check_range = PILLAR_SPACING * 2
         
-        min_grid_x = int((x - check_range) // PILLAR_SPACING) * PILLAR_SPACING
-        max_grid_x = int((x + check_range) // PILLAR_SPACING) * PILLAR_SPACING
-        min_grid_z = int((z - check_range) // PILLAR_SPACING) * PILLAR_SPACING
-        max_grid_z = int((z + check_range) // PILLAR_SPACING) * PILLAR_SPACING
+        min_grid_x = int((x - check_range) // PILLAR_SPACING)
+        max_grid_x = int((x + check_range) // PILLAR_SPACING)
+        min_grid_z = int((z - check_range) // PILLAR_SPACING)
+        max_grid_z = int((z + check_range) // PILLAR_SPACING)
         
-        for px in range(min_grid_x, max_grid_x + PILLAR_SPACING, PILLAR_SPACING):
-            for pz in range(min_grid_z, max_grid_z + PILLAR_SPACING, PILLAR_SPACING):
-                
-                # Horizontal walls
-                if self.world.has_wall_between(px, pz, px + PILLAR_SPACING, pz):
-                    wall_key = tuple(sorted([(px, pz), (px + PILLAR_SPACING, pz)]))
-                    if wall_key not in self.world.destroyed_walls:
-                        
-                        opening_type = self.world.get_doorway_type(px, pz, px + PILLAR_SPACING, pz)
-                        wall_z = pz
-                        wall_x_start = px
-                        wall_x_end = px + PILLAR_SPACING
-                        
-                        if opening_type == "hallway":
-                            opening_width = HALLWAY_WIDTH
-                        elif opening_type == "doorway":
-                            opening_width = 60
-                        else:
-                            opening_width = 0
-                        
-                        if opening_width > 0:
-                            # Wall with opening - create segments + doorway edges
-                            opening_start = wall_x_start + (PILLAR_SPACING - opening_width) / 2
-                            opening_end = opening_start + opening_width
-                            
-                            # Left wall segment (both sides)
-                            segments.append((wall_x_start, wall_z - half_thick,
-                                           opening_start, wall_z - half_thick))
-                            segments.append((wall_x_start, wall_z + half_thick,
-                                           opening_start, wall_z + half_thick))
-                            
-                            # Right wall segment (both sides)
-                            segments.append((opening_end, wall_z - half_thick,
-                                           wall_x_end, wall_z - half_thick))
-                            segments.append((opening_end, wall_z + half_thick,
-                                           wall_x_end, wall_z + half_thick))
-                            
-                            # Doorway edges (perpendicular segments)
-                            segments.append((opening_start, wall_z - half_thick,
-                                           opening_start, wall_z + half_thick))
-                            segments.append((opening_end, wall_z - half_thick,
-                                           opening_end, wall_z + half_thick))
-                        else:
-                            # Solid wall
-                            segments.append((wall_x_start, wall_z - half_thick,
-                                           wall_x_end, wall_z - half_thick))
-                            segments.append((wall_x_start, wall_z + half_thick,
-                                           wall_x_end, wall_z + half_thick))
-                
-                # Vertical walls (same logic, rotated)
-                if self.world.has_wall_between(px, pz, px, pz + PILLAR_SPACING):
-                    wall_key = tuple(sorted([(px, pz), (px, pz + PILLAR_SPACING)]))
-                    if wall_key not in self.world.destroyed_walls:
-                        
-                        opening_type = self.world.get_doorway_type(px, pz, px, pz + PILLAR_SPACING)
-                        wall_x = px
-                        wall_z_start = pz
-                        wall_z_end = pz + PILLAR_SPACING
-                        
-                        if opening_type == "hallway":
-                            opening_width = HALLWAY_WIDTH
-                        elif opening_type == "doorway":
-                            opening_width = 60
-                        else:
-                            opening_width = 0
-                        
-                        if opening_width > 0:
-                            opening_start = wall_z_start + (PILLAR_SPACING - opening_width) / 2
-                            opening_end = opening_start + opening_width
-                            
-                            # Bottom wall segment (both sides)
-                            segments.append((wall_x - half_thick, wall_z_start,
-                                           wall_x - half_thick, opening_start))
-                            segments.append((wall_x + half_thick, wall_z_start,
-                                           wall_x + half_thick, opening_start))
-                            
-                            # Top wall segment (both sides)
-                            segments.append((wall_x - half_thick, opening_end,
-                                           wall_x - half_thick, wall_z_end))
-                            segments.append((wall_x + half_thick, opening_end,
-                                           wall_x + half_thick, wall_z_end))
-                            
-                            # Doorway edges (perpendicular segments)
-                            segments.append((wall_x - half_thick, opening_start,
-                                           wall_x + half_thick, opening_start))
-                            segments.append((wall_x - half_thick, opening_end,
-                                           wall_x + half_thick, opening_end))
-                        else:
-                            segments.append((wall_x - half_thick, wall_z_start,
-                                           wall_x - half_thick, wall_z_end))
-                            segments.append((wall_x + half_thick, wall_z_start,
-                                           wall_x + half_thick, wall_z_end))
-                
-                # Pillars (check if they exist)
-                offset = PILLAR_SPACING // 2
-                pillar_x = px + offset
-                pillar_z = pz + offset
-                
-                if self.world.has_pillar_at(pillar_x, pillar_z):
-                    pillar_key = (pillar_x, pillar_z)
-                    if pillar_key not in self.world.destroyed_pillars:
-                        s = PILLAR_SIZE
-                        
-                        # Four sides of pillar
-                        segments.append((pillar_x, pillar_z, pillar_x + s, pillar_z))  # Front
-                        segments.append((pillar_x + s, pillar_z, pillar_x + s, pillar_z + s))  # Right
-                        segments.append((pillar_x + s, pillar_z + s, pillar_x, pillar_z + s))  # Back
-                        segments.append((pillar_x, pillar_z + s, pillar_x, pillar_z))  # Left
+        for gx in range(min_grid_x, max_grid_x + 1):
+            for gz in range(min_grid_z, max_grid_z + 1):
+                extend(collision_segments(gx, gz))
         
         return segments
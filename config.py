@@ -92,6 +92,8 @@ TEXTURE_SIZE = 256
 
 # Save/load settings
 SAVE_DIR = "backrooms_saves"
+SAVE_FORMAT = "pickle"  # "pickle" (fastest), "msgpack" (compact binary) or "json" (human-readable)
+SAVE_COMPRESSION = True  # zstd-compress save files (requires zstandard)
 
 
 # Helper functions for scaled heights
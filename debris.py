@@ -1,274 +1,165 @@
 """
-Debris physics + structural failure system.
+Debris physics system.
 Includes:
 - Pixel debris
-- Cracks
-- Stress accumulation
-- Leaning walls
-- Falling slabs
-- Rubble piles
 """
 
-import random
-import math
-from enum import Enum
-from config import NEAR
+import numpy as np
 
 
 # ============================================================
-# DAMAGE STATES
+# DEBRIS FIELD (structure-of-arrays, used by World)
 # ============================================================
 
-class DamageState(Enum):
-    INTACT = 0
-    CRACKED = 1
-    FRACTURED = 2
-    LEANING = 3
-    FALLING = 4
-    RUBBLE = 5
-
-
-# ============================================================
-# CRACKS (stress guides, not particles)
-# ============================================================
-
-class Crack:
+class DebrisField:
     """
-    Represents a growing crack on a wall surface.
-    """
-
-    def __init__(self, origin, angle):
-        self.origin = origin        # (u, v) on wall face (0–1)
-        self.angle = angle          # radians
-        self.length = 0.0
-        self.max_length = random.uniform(0.8, 2.5)
-        self.growth_rate = random.uniform(0.4, 1.0)
-
-    def grow(self, dt):
-        if self.length < self.max_length:
-            self.length += self.growth_rate * dt
-            if self.length > self.max_length:
-                self.length = self.max_length
-
-
-# ============================================================
-# PIXEL DEBRIS (unchanged, your original class)
-# ============================================================
-
-class Debris:
-    """Individual pixel-sized piece of debris from destroyed walls."""
-
-    def __init__(self, position, color, velocity=None):
-        self.cx, self.cy, self.cz = position
-        self.color = color
-        self.active = True
-
-        if velocity is None:
-            self.vx = self.vy = self.vz = 0
-            self.is_settled = True
-        else:
-            self.vx, self.vy, self.vz = velocity
-            self.is_settled = False
-
-        self.settle_timer = 0
-        self.pixel_size = 0.15
-
-        self.age = 0.0
-        self.settled_age = 0.0
-        self.max_age = random.uniform(8.0, 18.0)
-        self.max_settled_age = random.uniform(2.0, 6.0)
-
-    def update(self, dt, floor_y):
-        if not self.active:
-            return
-
-        self.age += dt
-        if self.age > self.max_age:
-            self.active = False
-            return
-
-        if self.is_settled:
-            self.settled_age += dt
-            if self.settled_age > self.max_settled_age:
-                self.active = False
-            return
-
-        self.vy -= 40 * dt
-        self.cx += self.vx * dt
-        self.cy += self.vy * dt
-        self.cz += self.vz * dt
-
-        if self.cy <= floor_y:
-            self.cy = floor_y
-            self.vy = -self.vy * 0.1
-            self.vx *= 0.6
-            self.vz *= 0.6
-
-        speed = math.sqrt(self.vx**2 + self.vy**2 + self.vz**2)
-        if speed < 0.5 and abs(self.cy - floor_y) < 0.5:
-            self.settle_timer += dt
-            if self.settle_timer > 0.3:
-                self.is_settled = True
-                self.vx = self.vy = self.vz = 0
-                self.cy = floor_y
-                self.settled_age = 0.0
-
-    def get_screen_pos(self, engine):
-        cam_pos = engine.world_to_camera(self.cx, self.cy, self.cz)
-        if cam_pos[2] <= NEAR:
-            return None
-        return engine.project_camera(cam_pos)
-
-
-# ============================================================
-# RUBBLE CHUNKS (heavy, persistent)
-# ============================================================
+    All of a world's pixel debris as parallel NumPy arrays.
 
-class RubbleChunk:
+    Pieces fall, bounce off the floor, settle and expire, all updated at
+    once. They live in the first `count` slots, with dead ones left in
+    place as inactive holes: spawn() refills holes before growing, and
+    trim() shrinks `count` past dead slots at the end, so nothing is
+    copied to remove a piece.
     """
-    Heavy rubble piece that settles and persists.
-    """
-
-    def __init__(self, position, color, velocity):
-        self.cx, self.cy, self.cz = position
-        self.color = color
-        self.vx, self.vy, self.vz = velocity
 
-        self.size = random.uniform(0.25, 0.6)
-        self.is_settled = False
-        self.settle_timer = 0.0
-        self.active = True
+    FLOAT_FIELDS = ('cx', 'cy', 'cz', 'vx', 'vy', 'vz',
+                    'age', 'settled_age', 'max_age', 'max_settled_age', 'settle_timer')
+
+    def __init__(self, capacity, rng=None):
+        self.capacity = capacity
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.count = 0  # slots in use, live or dead
+
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float32))
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.is_settled = np.zeros(capacity, dtype=bool)
+        self.active = np.zeros(capacity, dtype=bool)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.active[:self.count]))
+
+    def clear(self):
+        """Remove all debris."""
+        self.active[:self.count] = False
+        self.count = 0
+
+    def spawn(self, positions, colors, velocities=None, settled=None):
+        """
+        Add a batch of debris from (N, 3) position, color and velocity
+        arrays. velocities=None spawns the whole batch settled; otherwise
+        an optional settled mask marks pieces that start at rest.
+        When the field is full, the oldest pieces make room.
+        """
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+        n = len(positions)
+        if n == 0:
+            return
+        if n > self.capacity:
+            positions = positions[-self.capacity:]
+            colors = np.asarray(colors)[-self.capacity:]
+            if velocities is not None:
+                velocities = np.asarray(velocities)[-self.capacity:]
+            if settled is not None:
+                settled = np.asarray(settled)[-self.capacity:]
+            n = self.capacity
+
+        slots = self._free_slots(n)
+        self.cx[slots], self.cy[slots], self.cz[slots] = positions.T
+        self.color[slots] = np.asarray(colors).reshape(-1, 3)
+
+        if velocities is None:
+            settled = np.ones(n, dtype=bool)
+            self.vx[slots] = self.vy[slots] = self.vz[slots] = 0
+        else:
+            settled = np.zeros(n, dtype=bool) if settled is None else np.asarray(settled, dtype=bool)
+            velocities = np.asarray(velocities, dtype=np.float32).reshape(-1, 3)
+            self.vx[slots], self.vy[slots], self.vz[slots] = np.where(
+                settled[:, None], 0, velocities
+            ).T
+        self.is_settled[slots] = settled
+
+        self.age[slots] = 0
+        self.settled_age[slots] = 0
+        self.settle_timer[slots] = 0
+        self.max_age[slots] = self.rng.uniform(8.0, 18.0, n)
+        self.max_settled_age[slots] = self.rng.uniform(2.0, 6.0, n)
+        self.active[slots] = True
+
+    def _free_slots(self, n):
+        """
+        Slot indices for n new pieces: dead slots first, then unused ones,
+        then the slots of the oldest live pieces.
+        """
+        slots = np.flatnonzero(~self.active[:self.count])[:n]
+        need = n - len(slots)
+        if need > 0:
+            grow = min(need, self.capacity - self.count)
+            slots = np.concatenate((slots, np.arange(self.count, self.count + grow)))
+            self.count += grow
+            need -= grow
+        if need > 0:
+            # Field is full - evict the oldest live pieces (dead slots
+            # were all taken above, so mask them out)
+            age = np.where(self.active[:self.count], self.age[:self.count], -1.0)
+            slots = np.concatenate((slots, np.argpartition(age, -need)[-need:]))
+        return slots
 
     def update(self, dt, floor_y):
-        if not self.active:
+        """Advance every live piece by dt; pieces that expire are deactivated."""
+        n = self.count
+        if n == 0:
             return
 
-        self.vy -= 60 * dt
-        self.cx += self.vx * dt
-        self.cy += self.vy * dt
-        self.cz += self.vz * dt
-
-        if self.cy <= floor_y:
-            self.cy = floor_y
-            self.vy = -self.vy * 0.05
-            self.vx *= 0.4
-            self.vz *= 0.4
-
-            speed = math.sqrt(self.vx**2 + self.vy**2 + self.vz**2)
-            if speed < 0.3:
-                self.settle_timer += dt
-                if self.settle_timer > 0.5:
-                    self.is_settled = True
-                    self.vx = self.vy = self.vz = 0
-
-
-# ============================================================
-# DAMAGED WALL CONTROLLER (Steps 1–4)
-# ============================================================
-
-class DamagedWall:
-    """
-    Structural damage controller for a wall.
-    """
-
-    def __init__(self):
-        self.state = DamageState.INTACT
-        self.stress = 0.0
-        self.cracks = []
-
-        self.rotation = 0.0
-        self.angular_velocity = 0.0
-        self.max_lean = math.radians(8)
-        self.pressure_y = random.uniform(0.1, 0.9)
-
-        self.vy = 0.0
-        self.has_impacted = False
-
-        self.rubble_chunks = []
-        self.dust_debris = []
-
-    # ------------------------
-    # APPLY DAMAGE
-    # ------------------------
-
-    def apply_hit(self, hit_uv, force=1.0):
-        self.stress += force
-
-        if self.state == DamageState.INTACT:
-            self.state = DamageState.CRACKED
-            self.cracks.append(Crack(hit_uv, random.uniform(0, math.pi)))
-
-        elif self.state == DamageState.CRACKED and self.stress > 2.0:
-            self.state = DamageState.FRACTURED
-            self.cracks.append(Crack(hit_uv, random.uniform(0, math.pi)))
-
-        elif self.state == DamageState.FRACTURED and self.stress > 4.0:
-            self.state = DamageState.LEANING
-
-    # ------------------------
-    # UPDATE
-    # ------------------------
-
-    def update(self, dt, floor_y=0.0):
-        for crack in self.cracks:
-            crack.grow(dt)
-
-        if self.state == DamageState.LEANING:
-            torque = (1.0 - self.pressure_y) * 3.5
-            self.angular_velocity += torque * dt
-            self.angular_velocity *= 0.98
-            self.rotation += self.angular_velocity * dt
-
-            if self.rotation >= self.max_lean:
-                self.state = DamageState.FALLING
-                self.vy = 0.0
-
-        elif self.state == DamageState.FALLING:
-            self.vy -= 30.0 * dt
-            if not self.has_impacted and abs(self.vy) > 6.0:
-                self._on_impact()
-
-        elif self.state == DamageState.RUBBLE:
-            for chunk in self.rubble_chunks:
-                chunk.update(dt, floor_y)
-            for d in self.dust_debris:
-                d.update(dt, floor_y)
-
-    # ------------------------
-    # IMPACT → RUBBLE
-    # ------------------------
-
-    def _on_impact(self):
-        self.has_impacted = True
-        self.state = DamageState.RUBBLE
-
-        # Spawn rubble
-        for _ in range(random.randint(4, 9)):
-            self.rubble_chunks.append(
-                RubbleChunk(
-                    position=(0, 0, 0),
-                    color=(180, 170, 160),
-                    velocity=(
-                        random.uniform(-1.5, 1.5),
-                        random.uniform(0.5, 2.5),
-                        random.uniform(-1.5, 1.5),
-                    )
-                )
-            )
-
-        # Spawn dust
-        for _ in range(random.randint(20, 50)):
-            self.dust_debris.append(
-                Debris(
-                    position=(0, 0, 0),
-                    color=(200, 190, 180),
-                    velocity=(
-                        random.uniform(-2.5, 2.5),
-                        random.uniform(1.0, 4.0),
-                        random.uniform(-2.5, 2.5),
-                    )
-                )
-            )
-
-        self.vy = 0.0
-        self.angular_velocity = 0.0
+        active = self.active[:n]
+        age = self.age[:n]
+        age += dt
+        active &= age <= self.max_age[:n]
+
+        # Settled pieces only wait out their remaining lifetime
+        settled = active & self.is_settled[:n]
+        settled_age = self.settled_age[:n]
+        settled_age[settled] += dt
+        active &= ~(settled & (settled_age > self.max_settled_age[:n]))
+
+        moving = active & ~self.is_settled[:n]
+        cx, cy, cz = self.cx[:n], self.cy[:n], self.cz[:n]
+        vx, vy, vz = self.vx[:n], self.vy[:n], self.vz[:n]
+
+        vy[moving] -= 40 * dt
+        cx[moving] += vx[moving] * dt
+        cy[moving] += vy[moving] * dt
+        cz[moving] += vz[moving] * dt
+
+        # Bounce off the floor
+        landed = moving & (cy <= floor_y)
+        cy[landed] = floor_y
+        vy[landed] *= -0.1
+        vx[landed] *= 0.6
+        vz[landed] *= 0.6
+
+        # Come to rest once slow and on the floor for long enough
+        slow = moving & (np.sqrt(vx * vx + vy * vy + vz * vz) < 0.5) & (np.abs(cy - floor_y) < 0.5)
+        settle_timer = self.settle_timer[:n]
+        settle_timer[slow] += dt
+        newly_settled = slow & (settle_timer > 0.3)
+        self.is_settled[:n] |= newly_settled
+        vx[newly_settled] = vy[newly_settled] = vz[newly_settled] = 0
+        cy[newly_settled] = floor_y
+        settled_age[newly_settled] = 0
+
+    def cull(self, x, z, max_dist):
+        """Deactivate pieces farther than max_dist from (x, z) on the ground plane."""
+        n = self.count
+        dx = self.cx[:n] - x
+        dz = self.cz[:n] - z
+        self.active[:n] &= (dx * dx + dz * dz) <= max_dist * max_dist
+
+    def trim(self):
+        """Stop scanning the run of dead slots at the end of the field."""
+        live = np.flatnonzero(self.active[:self.count])
+        self.count = int(live[-1]) + 1 if len(live) else 0
+
+    def live_indices(self):
+        """Indices of the live pieces."""
+        return np.flatnonzero(self.active[:self.count])
@@ -87,7 +87,8 @@ class BackroomsEngine:
 
     @property
     def destroyed_walls(self):
-        return self.world.destroyed_walls
+        """Destroyed wall keys. Rebuilt from the world on every access - O(N)."""
+        return self.world.destroyed_wall_keys()
 
     @property
     def x_s(self):
@@ -5,10 +5,11 @@ Handles 3D polygon rendering, debris, and visual effects.
 
 import math
 import random
+import numpy as np
 import pygame
 from config import (
     RENDER_SCALE, NEAR, RENDER_DISTANCE, BLACK,
-    PILLAR_SPACING, PILLAR_SIZE, WALL_THICKNESS, HALLWAY_WIDTH,
+    PILLAR_SPACING, PILLAR_SIZE, WALL_THICKNESS,
     FOG_ENABLED, FOG_START, FOG_END, FOG_COLOR,
     FLICKER_CHANCE, FLICKER_DURATION, FLICKER_BRIGHTNESS,
     get_scaled_wall_height, get_scaled_floor_y
@@ -382,46 +383,46 @@ class Renderer:
         for px in range(start_x, end_x + PILLAR_SPACING, PILLAR_SPACING):
             for pz in range(start_z, end_z + PILLAR_SPACING, PILLAR_SPACING):
                 # Horizontal walls
-                wall_key_h = tuple(sorted([(px, pz), (px + PILLAR_SPACING, pz)]))
-                if world.has_wall_between(px, pz, px + PILLAR_SPACING, pz) and not world.is_wall_destroyed(wall_key_h):
+                wall_h = world.get_wall_record(px, pz, px + PILLAR_SPACING, pz)
+                if wall_h is not None and not world.is_wall_record_destroyed(wall_h):
                     wall_center_x = px + PILLAR_SPACING / 2
                     wall_center_z = pz
                     dist = math.sqrt((wall_center_x - camera.x_s) ** 2 + (wall_center_z - camera.z_s) ** 2)
 
-                    def make_draw_func(px=px, pz=pz):
+                    def make_draw_func(record=wall_h):
                         return lambda surface, camera=camera, world=world: self._draw_connecting_wall(
-                            surface, camera, world, px, pz, px + PILLAR_SPACING, pz)
+                            surface, camera, world, record)
 
                     render_items.append((dist, make_draw_func()))
 
                 # Vertical walls
-                wall_key_v = tuple(sorted([(px, pz), (px, pz + PILLAR_SPACING)]))
-                if world.has_wall_between(px, pz, px, pz + PILLAR_SPACING) and not world.is_wall_destroyed(wall_key_v):
+                wall_v = world.get_wall_record(px, pz, px, pz + PILLAR_SPACING)
+                if wall_v is not None and not world.is_wall_record_destroyed(wall_v):
                     wall_center_x = px
                     wall_center_z = pz + PILLAR_SPACING / 2
                     dist = math.sqrt((wall_center_x - camera.x_s) ** 2 + (wall_center_z - camera.z_s) ** 2)
 
-                    def make_draw_func(px=px, pz=pz):
+                    def make_draw_func(record=wall_v):
                         return lambda surface, camera=camera, world=world: self._draw_connecting_wall(
-                            surface, camera, world, px, pz, px, pz + PILLAR_SPACING)
+                            surface, camera, world, record)
 
                     render_items.append((dist, make_draw_func()))
 
         return render_items
 
-    def _draw_connecting_wall(self, surface, camera, world, x1, z1, x2, z2):
-        """Draw a connecting wall with doorways/hallways and damage."""
-        wall_key = tuple(sorted([(x1, z1), (x2, z2)]))
+    def _draw_connecting_wall(self, surface, camera, world, record):
+        """Draw a connecting wall (a WallRecord) with doorways/hallways and damage."""
+        wall_key = record.key
+        (x1, z1), (x2, z2) = wall_key
 
         # Check wall state
-        wall_state = world.get_wall_state(wall_key)
-        
+        wall_state = world.wall_state_of(record)
         if wall_state == WallState.DESTROYED:
             world.spawn_rubble_pile(x1, z1, x2, z2)
             return
 
         # Also check legacy damage system for pre-damaged walls
-        damage_state = world.get_wall_damage(wall_key)
+        damage_state = world.wall_damage_of(record)
         if damage_state < 0.2:
             world.spawn_rubble_pile(x1, z1, x2, z2)
             return
@@ -448,43 +449,35 @@ class Renderer:
 
         baseboard_height = 8
 
-        opening_type = world.get_doorway_type(x1, z1, x2, z2)
-
-        if opening_type is None:
+        if record.opening_type is None:
             self._draw_thick_wall_segment(surface, camera, world, x1, z1, x2, z2, h, floor_y,
                                           edge_color, baseboard_color, baseboard_height,
                                           wall_color_mod=wall_color_mod)
             # Draw cracks on top
             self._draw_wall_cracks(surface, camera, world, wall_key, x1, z1, x2, z2, h, floor_y)
         else:
-            opening_width = HALLWAY_WIDTH if opening_type == "hallway" else 60
+            # The record's key is sorted, so x1/z1 is the wall's start
+            opening_start = record.opening_start
+            opening_end = record.opening_end
 
             if x1 == x2:  # Vertical wall
-                wall_length = abs(z2 - z1)
-                opening_start = min(z1, z2) + (wall_length - opening_width) / 2
-                opening_end = opening_start + opening_width
-
-                if opening_start > min(z1, z2):
-                    self._draw_thick_wall_segment(surface, camera, world, x1, min(z1, z2), x2, opening_start,
+                if opening_start > z1:
+                    self._draw_thick_wall_segment(surface, camera, world, x1, z1, x2, opening_start,
                                                   h, floor_y, edge_color, baseboard_color, baseboard_height,
                                                   wall_color_mod=wall_color_mod)
 
-                if opening_end < max(z1, z2):
-                    self._draw_thick_wall_segment(surface, camera, world, x1, opening_end, x2, max(z1, z2),
+                if opening_end < z2:
+                    self._draw_thick_wall_segment(surface, camera, world, x1, opening_end, x2, z2,
                                                   h, floor_y, edge_color, baseboard_color, baseboard_height,
                                                   wall_color_mod=wall_color_mod)
             else:  # Horizontal wall
-                wall_length = abs(x2 - x1)
-                opening_start = min(x1, x2) + (wall_length - opening_width) / 2
-                opening_end = opening_start + opening_width
-
-                if opening_start > min(x1, x2):
-                    self._draw_thick_wall_segment(surface, camera, world, min(x1, x2), z1, opening_start, z2,
+                if opening_start > x1:
+                    self._draw_thick_wall_segment(surface, camera, world, x1, z1, opening_start, z2,
                                                   h, floor_y, edge_color, baseboard_color, baseboard_height,
                                                   wall_color_mod=wall_color_mod)
 
-                if opening_end < max(x1, x2):
-                    self._draw_thick_wall_segment(surface, camera, world, opening_end, z1, max(x1, x2), z2,
+                if opening_end < x2:
+                    self._draw_thick_wall_segment(surface, camera, world, opening_end, z1, x2, z2,
                                                   h, floor_y, edge_color, baseboard_color, baseboard_height,
                                                   wall_color_mod=wall_color_mod)
 
@@ -650,18 +643,19 @@ class Renderer:
         DEBRIS_RENDER_DIST = 600.0
         px, pz = camera.x_s, camera.z_s
 
-        debris_to_render = []
-        for d in world.debris_pieces:
-            if not d.active:
-                continue
-
-            dx = d.cx - px
-            dz = d.cz - pz
-            dist_sq = dx * dx + dz * dz
-            if dist_sq > DEBRIS_RENDER_DIST * DEBRIS_RENDER_DIST:
-                continue
+        # Distance-filter the whole debris field at once
+        field = world.debris
+        n = field.count
+        dx = field.cx[:n] - px
+        dz = field.cz[:n] - pz
+        dist_sq = dx * dx + dz * dz
+        near = np.flatnonzero(field.active[:n] & (dist_sq <= DEBRIS_RENDER_DIST * DEBRIS_RENDER_DIST))
 
-            cam_pos = camera.world_to_camera(d.cx, d.cy, d.cz)
+        debris_to_render = []
+        for cx, cy, cz, dist_sq, color in zip(
+                field.cx[near].tolist(), field.cy[near].tolist(), field.cz[near].tolist(),
+                dist_sq[near].tolist(), map(tuple, field.color[near].tolist())):
+            cam_pos = camera.world_to_camera(cx, cy, cz)
             if cam_pos[2] <= NEAR:
                 continue
 
@@ -673,7 +667,7 @@ class Renderer:
             if 0 <= sx < camera.width and 0 <= sy < camera.height:
                 dist = math.sqrt(dist_sq)
                 size = max(1, int(3 * (1.0 - dist / DEBRIS_RENDER_DIST)))
-                debris_to_render.append((cam_pos[2], sx, sy, size, d.color))
+                debris_to_render.append((cam_pos[2], sx, sy, size, color))
 
         # Sort back-to-front
         debris_to_render.sort(key=lambda x: x[0], reverse=True)
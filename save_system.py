@@ -1,6 +1,8 @@
 """
 Save/load system.
-Handles game state persistence to JSON files.
+Handles game state persistence. Each save slot is a small JSON header plus
+a world data file in pickle (default), MessagePack or JSON, optionally
+zstd-compressed.
 
 UPDATED: Now properly saves complete world state including:
 - wall_cache and pillar_cache (the actual map layout)
@@ -9,9 +11,253 @@ UPDATED: Now properly saves complete world state including:
 """
 
 import os
+import io
 import json
+import mmap
+import pickle
+import hashlib
 from datetime import datetime
-from config import SAVE_DIR
+from config import SAVE_DIR, SAVE_FORMAT, SAVE_COMPRESSION
+
+# orjson is optional - much faster (de)serialization of large world states
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# python-rapidjson is optional - faster JSON parsing when orjson isn't installed
+try:
+    import rapidjson
+    RAPIDJSON_AVAILABLE = True
+except ImportError:
+    RAPIDJSON_AVAILABLE = False
+
+# msgpack is optional - falls back to pickle saves if not installed
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# zstandard is optional - saves are written uncompressed if not installed
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Frame header every zstd-compressed file starts with
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+ZSTD_LEVEL = 3
+
+# Parsed save info per save path: path -> ((mtime_ns, size), info)
+_info_cache = {}
+
+# Uncompressed msgpack/JSON saves at least this large are parsed from an
+# mmap instead of read()
+MMAP_THRESHOLD = 64 * 1024
+
+# Buffer size for save file writes (fewer, larger write() syscalls)
+WRITE_BUFFER_SIZE = 1 << 20
+
+# File extension for each on-disk save format
+SAVE_EXTENSIONS = {
+    'pickle': '.pkl',
+    'msgpack': '.msgpack',
+    'json': '.json',
+}
+
+# First byte of every pickle written with protocol 2 or newer (PROTO opcode)
+PICKLE_MAGIC = b'\x80'
+
+
+def _resolve_format(fmt=None):
+    """Pick the save format to write, falling back to pickle if unavailable."""
+    fmt = fmt or SAVE_FORMAT
+    if fmt == 'msgpack' and not MSGPACK_AVAILABLE:
+        return 'pickle'
+    return fmt if fmt in SAVE_EXTENSIONS else 'pickle'
+
+
+class _SaveUnpickler(pickle.Unpickler):
+    """
+    Unpickler that refuses to import anything.
+    Save data is plain dicts/lists/tuples/sets of numbers and strings, so
+    no globals are ever needed - this blocks the usual pickle code
+    execution tricks if a save file has been tampered with.
+    """
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"save files may not reference {module}.{name}")
+
+
+def _to_builtin(o):
+    """
+    Convert values the encoders don't support natively.
+    Passed as default= so the rest of the world state is walked in C
+    instead of being converted in a Python pre-pass.
+    """
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not serializable")
+
+
+def _dumps(data, pretty=False):
+    """Serialize save data to JSON bytes (compact unless pretty)."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_to_builtin, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, default=_to_builtin).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), default=_to_builtin).encode('utf-8')
+
+
+def _loads(raw):
+    """Parse JSON bytes (or, with orjson, a bytes-like buffer) into save data."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    if RAPIDJSON_AVAILABLE:
+        return rapidjson.loads(raw)
+    return json.loads(raw)
+
+
+def _encode_save(data, fmt, pretty=False):
+    """Serialize save data in the given format to bytes."""
+    if fmt == 'pickle':
+        return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    if fmt == 'msgpack':
+        return msgpack.packb(data, use_bin_type=True, default=_to_builtin)
+    return _dumps(data, pretty)
+
+
+def _save_digest(raw, compress=False):
+    """
+    Content hash of encoded save data, as stored in the slot header.
+    Covers the compression setting too, since that changes the bytes on disk.
+    """
+    h = hashlib.blake2b(raw, digest_size=16)
+    h.update(b'zstd' if compress and ZSTD_AVAILABLE else b'raw')
+    return h.hexdigest()
+
+
+def _write_save(path, raw, compress=False):
+    """
+    Write encoded save data to path through a large write buffer.
+    Writes a temporary file and renames it over the old save, so a crash
+    mid-write never leaves a corrupted slot behind.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        if compress and ZSTD_AVAILABLE:
+            cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+            with cctx.stream_writer(f, closefd=False) as out:
+                out.write(raw)
+        else:
+            f.write(raw)
+    os.replace(tmp_path, path)
+
+
+def _write_file(path, raw):
+    """Atomically replace path with raw bytes."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(raw)
+    os.replace(tmp_path, path)
+
+
+def _read_save(path):
+    """
+    Read and parse a save file, dispatching on its extension.
+    Compressed files are recognized by the zstd magic bytes, so plain
+    and compressed saves load the same way.
+    """
+    # Only msgpack and orjson parse a mapped buffer in place; pickle and
+    # compressed saves would copy it into a new buffer anyway
+    parses_buffer = (path.endswith(SAVE_EXTENSIONS['msgpack'])
+                     or (ORJSON_AVAILABLE and path.endswith(SAVE_EXTENSIONS['json'])))
+    with open(path, 'rb') as f:
+        if (not parses_buffer or os.fstat(f.fileno()).st_size < MMAP_THRESHOLD
+                or f.read(4) == ZSTD_MAGIC):
+            f.seek(0)
+            return _parse_save(f.read(), path)
+        # Parse large saves straight from mapped pages, skipping the read() copy
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _parse_save(view, path)
+
+
+def _parse_save(raw, path):
+    """Parse save bytes (or a bytes-like buffer) read from path."""
+    if raw[:4] == ZSTD_MAGIC:
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("save is zstd-compressed but zstandard is not installed")
+        # Streamed frames don't record their size, so decompress incrementally
+        raw = zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+    if path.endswith(SAVE_EXTENSIONS['pickle']):
+        if raw[:1] != PICKLE_MAGIC:
+            raise ValueError(f"{path} is not a pickle save")
+        # Only ever unpickle files from our own save directory
+        save_dir = os.path.realpath(SAVE_DIR)
+        if os.path.dirname(os.path.realpath(path)) != save_dir:
+            raise ValueError(f"refusing to unpickle {path} outside {save_dir}")
+        return _SaveUnpickler(io.BytesIO(raw)).load()
+    if path.endswith(SAVE_EXTENSIONS['msgpack']):
+        if not MSGPACK_AVAILABLE:
+            raise RuntimeError("save is MessagePack but msgpack is not installed")
+        return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+    return _loads(raw)
+
+
+def _world_counts(world_data):
+    """Entry counts of a world state (measured for saves without 'counts')."""
+    counts = world_data.get('counts')
+    if counts is not None:
+        return counts
+    return {
+        'walls': len(world_data.get('wall_cache', {})),
+        'pillars': len(world_data.get('pillar_cache', {})),
+        'destroyed_walls': len(world_data.get('destroyed_walls', [])),
+        'destroyed_pillars': len(world_data.get('destroyed_pillars', [])),
+        'debris': len(world_data.get('debris_pieces', []))
+    }
+
+
+def _world_summary(world_data):
+    """Seed and entry counts of a world state, stored as the save's summary."""
+    counts = _world_counts(world_data)
+    return {
+        'world_seed': world_data.get('seed', 0),
+        'walls_explored': counts['walls'],
+        'pillars_explored': counts['pillars'],
+        'walls_destroyed': counts['destroyed_walls'],
+        'pillars_destroyed': counts['destroyed_pillars'],
+        'debris_count': counts['debris']
+    }
+
+
+def _summarize(save_data):
+    """Build the save info shown in menus from full save data."""
+    player_data = save_data.get('player', {})
+    summary = save_data.get('summary')
+    if summary is None:
+        # Version 1.1 saves have no summary - count the world itself
+        summary = _world_summary(save_data.get('world', {}))
+
+    info = {
+        'version': save_data.get('version', '1.0'),
+        'timestamp': save_data.get('timestamp', 'Unknown'),
+        'play_time': save_data.get('stats', {}).get('play_time', 0),
+        'player_position': (
+            player_data.get('x', 0),
+            player_data.get('y', 0),
+            player_data.get('z', 0)
+        )
+    }
+    info.update(summary)
+    return info
 
 
 class SaveSystem:
@@ -25,25 +271,63 @@ class SaveSystem:
 
     @staticmethod
     def get_save_path(slot=1):
-        """Get filepath for a save slot."""
+        """Get filepath for a save slot's JSON header."""
         SaveSystem.ensure_save_dir()
         return os.path.join(SAVE_DIR, f"save_slot_{slot}.json")
 
     @staticmethod
-    def save_game(engine, slot=1):
+    def get_world_path(slot=1, fmt=None):
+        """Get filepath for a save slot's world data in the given (or configured) format."""
+        SaveSystem.ensure_save_dir()
+        ext = SAVE_EXTENSIONS[_resolve_format(fmt)]
+        return os.path.join(SAVE_DIR, f"save_slot_{slot}.world{ext}")
+
+    @staticmethod
+    def find_save_path(slot=1):
+        """Get filepath of an existing save for a slot, or None."""
+        save_path = SaveSystem.get_save_path(slot)
+        if os.path.exists(save_path):
+            return save_path
+        return None
+
+    @staticmethod
+    def save_game(engine, slot=1, fmt=None, compress=None, pretty=False):
         """
-        Save complete game state to JSON file.
+        Save complete game state to disk.
         
         Includes:
         - Player position and orientation
         - Complete world state (walls, pillars, damage, debris)
         - Play time statistics
+
+        Each slot is a small JSON header (save_slot_N.json) with the player,
+        stats and summary, plus a world data file it references
+        (save_slot_N.world.*). Menus only ever read the header.
+
+        fmt and compress override SAVE_FORMAT and SAVE_COMPRESSION for the
+        world data. JSON is written compact; fmt='json', compress=False,
+        pretty=True gives an indented, human-readable export for debugging.
         """
-        # Get complete world state from world object
-        world_state = engine.world.get_state_for_save()
-        
-        save_data = {
-            'version': '1.1',  # Updated version to indicate new save format
+        fmt = _resolve_format(fmt)
+
+        # Get complete world state from world object (arrays packed into
+        # raw bytes, except in JSON which stays readable)
+        world_state = engine.world.get_state_for_save(packed=fmt != 'json')
+        if compress is None:
+            compress = SAVE_COMPRESSION
+        world_path = SaveSystem.get_world_path(slot, fmt)
+        world_raw = _encode_save(world_state, fmt, pretty)
+        world_hash = _save_digest(world_raw, compress)
+
+        # Repeated saves of an unchanged world only rewrite the header
+        world_unchanged = world_hash == SaveSystem._read_world_hash(slot, world_path)
+        if not world_unchanged:
+            _write_save(world_path, world_raw, compress)
+
+        header = {
+            # 1.2: header + world data file, packed map layout and debris,
+            # quantized wall damage, summary and world hash
+            'version': '1.2',
             'timestamp': datetime.now().isoformat(),
             'player': {
                 'x': engine.x,
@@ -52,45 +336,58 @@ class SaveSystem:
                 'pitch': engine.pitch,
                 'yaw': engine.yaw
             },
-            'world': world_state,
             'stats': {
                 'play_time': engine.play_time
-            }
+            },
+            'summary': _world_summary(world_state),
+            'world_ref': os.path.basename(world_path),
+            'world_hash': world_hash
         }
+        # Written after the world data so the header never points at a partial file
+        _write_file(SaveSystem.get_save_path(slot), _dumps(header, pretty))
 
-        save_path = SaveSystem.get_save_path(slot)
-        with open(save_path, 'w') as f:
-            json.dump(save_data, f, indent=2)
+        # Remove world data left in other formats
+        for other, ext in SAVE_EXTENSIONS.items():
+            stale_path = os.path.join(SAVE_DIR, f"save_slot_{slot}.world{ext}")
+            if other != fmt and os.path.exists(stale_path):
+                os.remove(stale_path)
 
+        counts = world_state['counts']
         print(f"Game saved to slot {slot}")
-        print(f"  Saved {len(world_state.get('wall_cache', {}))} walls")
-        print(f"  Saved {len(world_state.get('pillar_cache', {}))} pillars")
-        print(f"  Saved {len(world_state.get('destroyed_walls', []))} destroyed walls")
-        print(f"  Saved {len(world_state.get('debris_pieces', []))} debris pieces")
+        if world_unchanged:
+            print("  World unchanged, skipped rewriting world data")
+        print(f"  Saved {counts['walls']} walls")
+        print(f"  Saved {counts['pillars']} pillars")
+        print(f"  Saved {counts['destroyed_walls']} destroyed walls")
+        print(f"  Saved {counts['debris']} debris pieces")
         return True
 
     @staticmethod
     def load_game(slot=1):
-        """Load game state from JSON file."""
-        save_path = SaveSystem.get_save_path(slot)
+        """Load game state from a save file."""
+        save_path = SaveSystem.find_save_path(slot)
 
-        if not os.path.exists(save_path):
+        if save_path is None:
             print(f"No save found in slot {slot}")
             return None
 
         try:
-            with open(save_path, 'r') as f:
-                save_data = json.load(f)
+            save_data = _read_save(save_path)
+
+            # Version 1.2+ keeps the world in its own data file
+            world_ref = save_data.pop('world_ref', None)
+            if world_ref is not None:
+                world_path = os.path.join(SAVE_DIR, os.path.basename(world_ref))
+                save_data['world'] = _read_save(world_path)
             
             version = save_data.get('version', '1.0')
             print(f"Game loaded from slot {slot} (version {version})")
             
             # Show what was loaded
             world_data = save_data.get('world', {})
-            if 'wall_cache' in world_data:
-                print(f"  Loaded {len(world_data['wall_cache'])} walls")
-            if 'pillar_cache' in world_data:
-                print(f"  Loaded {len(world_data['pillar_cache'])} pillars")
+            counts = _world_counts(world_data)
+            print(f"  Loaded {counts['walls']} walls")
+            print(f"  Loaded {counts['pillars']} pillars")
             
             return save_data
         except Exception as e:
@@ -102,61 +399,76 @@ class SaveSystem:
         """List all available save slots."""
         SaveSystem.ensure_save_dir()
         saves = []
-        for i in range(1, 6):  # Check slots 1-5
-            save_path = SaveSystem.get_save_path(i)
-            if os.path.exists(save_path):
-                try:
-                    with open(save_path, 'r') as f:
-                        data = json.load(f)
-                    
-                    # Get world stats if available
-                    world_data = data.get('world', {})
-                    walls_count = len(world_data.get('wall_cache', {}))
-                    destroyed_count = len(world_data.get('destroyed_walls', []))
-                    
-                    saves.append({
-                        'slot': i,
-                        'timestamp': data.get('timestamp', 'Unknown'),
-                        'play_time': data.get('stats', {}).get('play_time', 0),
-                        'version': data.get('version', '1.0'),
-                        'walls_explored': walls_count,
-                        'walls_destroyed': destroyed_count
-                    })
-                except:
-                    pass
+        for slot in range(1, 6):  # Check slots 1-5
+            entry = SaveSystem._list_entry(slot)
+            if entry is not None:
+                saves.append(entry)
         return saves
+
+    @staticmethod
+    def _list_entry(slot):
+        """Get the list_saves entry for a slot, or None if empty/unreadable."""
+        try:
+            info = SaveSystem._read_save_info(slot)
+        except Exception:
+            return None
+        if info is None:
+            return None
+        return {
+            'slot': slot,
+            'timestamp': info['timestamp'],
+            'play_time': info['play_time'],
+            'version': info['version'],
+            'walls_explored': info['walls_explored'],
+            'walls_destroyed': info['walls_destroyed']
+        }
     
     @staticmethod
     def get_save_info(slot=1):
         """Get detailed info about a specific save slot."""
-        save_path = SaveSystem.get_save_path(slot)
-        
-        if not os.path.exists(save_path):
-            return None
-        
         try:
-            with open(save_path, 'r') as f:
-                data = json.load(f)
-            
-            world_data = data.get('world', {})
-            player_data = data.get('player', {})
-            
-            return {
-                'version': data.get('version', '1.0'),
-                'timestamp': data.get('timestamp', 'Unknown'),
-                'play_time': data.get('stats', {}).get('play_time', 0),
-                'player_position': (
-                    player_data.get('x', 0),
-                    player_data.get('y', 0),
-                    player_data.get('z', 0)
-                ),
-                'world_seed': world_data.get('seed', 0),
-                'walls_explored': len(world_data.get('wall_cache', {})),
-                'pillars_explored': len(world_data.get('pillar_cache', {})),
-                'walls_destroyed': len(world_data.get('destroyed_walls', [])),
-                'pillars_destroyed': len(world_data.get('destroyed_pillars', [])),
-                'debris_count': len(world_data.get('debris_pieces', []))
-            }
+            return SaveSystem._read_save_info(slot)
         except Exception as e:
             print(f"Error reading save info: {e}")
             return None
+
+    @staticmethod
+    def _read_save_info(slot):
+        """
+        Read save info from the slot's header.
+        Version 1.1 saves keep the world inline and are summarized from
+        it instead.
+        """
+        save_path = SaveSystem.find_save_path(slot)
+
+        if save_path is None:
+            return None
+
+        # Skip re-reading entirely if the save hasn't changed since last time
+        st = os.stat(save_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        hit = _info_cache.get(save_path)
+        if hit is not None and hit[0] == stamp:
+            return dict(hit[1])
+
+        info = _summarize(_read_save(save_path))
+        info['player_position'] = tuple(info['player_position'])
+        _info_cache[save_path] = (stamp, info)
+        return dict(info)
+
+    @staticmethod
+    def _read_world_hash(slot, world_path):
+        """
+        Hash of the world data currently on disk for a slot, as recorded in
+        its header. None if the slot has no header pointing at world_path.
+        """
+        save_path = SaveSystem.get_save_path(slot)
+        if not os.path.exists(save_path) or not os.path.exists(world_path):
+            return None
+        try:
+            header = _read_save(save_path)
+        except (OSError, ValueError):
+            return None
+        if header.get('world_ref') != os.path.basename(world_path):
+            return None
+        return header.get('world_hash')
@@ -34,44 +34,44 @@ def find_targeted_wall_or_pillar(camera, world):
     for px in range(start_x, end_x + PILLAR_SPACING, PILLAR_SPACING):
         for pz in range(start_z, end_z + PILLAR_SPACING, PILLAR_SPACING):
             # Horizontal walls
-            if world.has_wall_between(px, pz, px + PILLAR_SPACING, pz):
-                wall_key = tuple(sorted([(px, pz), (px + PILLAR_SPACING, pz)]))
-                if not world.is_wall_destroyed(wall_key):
-                    half_thick = WALL_THICKNESS / 2
-                    z = pz
-                    x1, x2 = px, px + PILLAR_SPACING
-
-                    v0 = (x1, h, z - half_thick)
-                    v1 = (x2, h, z - half_thick)
-                    v2 = (x2, floor_y, z - half_thick)
-                    v3 = (x1, floor_y, z - half_thick)
-
-                    for tri in [(v0, v1, v2), (v0, v2, v3)]:
-                        hit = ray_intersects_triangle(ray_origin, ray_dir, *tri)
-                        if hit and hit[0] < max_distance and hit[0] < closest_dist:
-                            closest_dist = hit[0]
-                            closest_hit = wall_key
-                            hit_type = 'wall'
+            record = world.get_wall_record(px, pz, px + PILLAR_SPACING, pz)
+            if record is not None and not world.is_wall_record_destroyed(record):
+                wall_key = record.key
+                half_thick = WALL_THICKNESS / 2
+                z = pz
+                x1, x2 = px, px + PILLAR_SPACING
+
+                v0 = (x1, h, z - half_thick)
+                v1 = (x2, h, z - half_thick)
+                v2 = (x2, floor_y, z - half_thick)
+                v3 = (x1, floor_y, z - half_thick)
+
+                for tri in [(v0, v1, v2), (v0, v2, v3)]:
+                    hit = ray_intersects_triangle(ray_origin, ray_dir, *tri)
+                    if hit and hit[0] < max_distance and hit[0] < closest_dist:
+                        closest_dist = hit[0]
+                        closest_hit = wall_key
+                        hit_type = 'wall'
 
             # Vertical walls
-            if world.has_wall_between(px, pz, px, pz + PILLAR_SPACING):
-                wall_key = tuple(sorted([(px, pz), (px, pz + PILLAR_SPACING)]))
-                if not world.is_wall_destroyed(wall_key):
-                    half_thick = WALL_THICKNESS / 2
-                    x = px
-                    z1, z2 = pz, pz + PILLAR_SPACING
-
-                    v0 = (x - half_thick, h, z1)
-                    v1 = (x - half_thick, h, z2)
-                    v2 = (x - half_thick, floor_y, z2)
-                    v3 = (x - half_thick, floor_y, z1)
-
-                    for tri in [(v0, v1, v2), (v0, v2, v3)]:
-                        hit = ray_intersects_triangle(ray_origin, ray_dir, *tri)
-                        if hit and hit[0] < max_distance and hit[0] < closest_dist:
-                            closest_dist = hit[0]
-                            closest_hit = wall_key
-                            hit_type = 'wall'
+            record = world.get_wall_record(px, pz, px, pz + PILLAR_SPACING)
+            if record is not None and not world.is_wall_record_destroyed(record):
+                wall_key = record.key
+                half_thick = WALL_THICKNESS / 2
+                x = px
+                z1, z2 = pz, pz + PILLAR_SPACING
+
+                v0 = (x - half_thick, h, z1)
+                v1 = (x - half_thick, h, z2)
+                v2 = (x - half_thick, floor_y, z2)
+                v3 = (x - half_thick, floor_y, z1)
+
+                for tri in [(v0, v1, v2), (v0, v2, v3)]:
+                    hit = ray_intersects_triangle(ray_origin, ray_dir, *tri)
+                    if hit and hit[0] < max_distance and hit[0] < closest_dist:
+                        closest_dist = hit[0]
+                        closest_hit = wall_key
+                        hit_type = 'wall'
 
     # Check pillars
     offset = PILLAR_SPACING // 2
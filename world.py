@@ -10,6 +10,8 @@ UPDATED: Enhanced save/load to preserve exact map state including:
 
 import math
 import random
+import numpy as np
+from collections import namedtuple
 from enum import Enum, auto
 from config import (
     PILLAR_SPACING, PILLAR_SIZE, PILLAR_MODE, WALL_THICKNESS,
@@ -17,9 +19,350 @@ from config import (
     get_scaled_wall_height, get_scaled_floor_y
 )
 from procedural import ProceduralZone
-from debris import Debris
+from debris import DebrisField
 from events import event_bus, EventType
 
+# Debris limits
+MAX_DEBRIS = 12000
+DEBRIS_CULL_DIST = 900.0
+DEBRIS_CULL_INTERVAL = 30  # frames between distance culls while the player stays in one cell
+
+# Decimal places kept for damage floats in save data
+SAVE_FLOAT_DIGITS = 4
+
+# Quantized wall damage. wall_health holds ints in 0..WALL_HEALTH_SCALE
+# (uint8 range); a scale of 200 keeps quarter-health hits exact. Cracks
+# are (u, v) in thousandths plus angle and length in 0..255 steps.
+WALL_HEALTH_SCALE = 200
+CRACK_UV_SCALE = 1000
+CRACK_ANGLE_SCALE = 255 / math.pi
+CRACK_LENGTH_SCALE = 255
+
+# Most debris pieces written to a save (keeps save files small)
+MAX_SAVED_DEBRIS = 1000
+
+# Per-piece columns of the packed debris array in save data
+DEBRIS_SAVE_COLUMNS = ('cx', 'cy', 'cz', 'r', 'g', 'b', 'vx', 'vy', 'vz', 'is_settled')
+_DEBRIS_POSITION = slice(DEBRIS_SAVE_COLUMNS.index('cx'), DEBRIS_SAVE_COLUMNS.index('cz') + 1)
+_DEBRIS_COLOR = slice(DEBRIS_SAVE_COLUMNS.index('r'), DEBRIS_SAVE_COLUMNS.index('b') + 1)
+_DEBRIS_VELOCITY = slice(DEBRIS_SAVE_COLUMNS.index('vx'), DEBRIS_SAVE_COLUMNS.index('vz') + 1)
+_DEBRIS_SETTLED = DEBRIS_SAVE_COLUMNS.index('is_settled')
+
+
+def _pack_array(arr, packed=True):
+    """
+    Pack a NumPy array into raw bytes + dtype/shape for binary save data,
+    or into plain (nested) lists when packed is False, for JSON saves.
+    """
+    if not packed:
+        return arr.tolist()
+    return {
+        'dtype': arr.dtype.str,
+        'shape': list(arr.shape),
+        'data': arr.tobytes()
+    }
+
+
+def _unpack_array(saved, width=None):
+    """Rebuild a NumPy array saved by _pack_array (rows of width values for 2D lists)."""
+    if isinstance(saved, list):
+        arr = np.array(saved)
+        return arr if width is None else arr.reshape(-1, width)
+    return np.frombuffer(saved['data'], dtype=saved['dtype']).reshape(saved['shape'])
+
+
+def _pack_rows(rows, width, packed=True):
+    """Pack integer coordinate rows (walls or pillars) into an (N, width) int64 array."""
+    return _pack_array(np.array(rows, dtype=np.int64).reshape(-1, width), packed)
+
+
+MASK64 = (1 << 64) - 1
+INV_2_53 = 1.0 / (1 << 53)
+
+
+def _splitmix64(h):
+    """SplitMix64 step: scramble an integer into a well-mixed 64-bit hash."""
+    h = (h + 0x9E3779B97F4A7C15) & MASK64
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & MASK64
+    return h ^ (h >> 31)
+
+
+def _wall_decay_rolls(x1, z1, x2, z2, world_seed):
+    """
+    Two deterministic uniform [0, 1) rolls for a wall's pre-damage check.
+    Pure integer hashing, so no RNG object is built per wall.
+    """
+    h = _splitmix64(
+        (x1 * 0x9E3779B97F4A7C15 ^ z1 * 0xBF58476D1CE4E5B9 ^ x2 * 0x94D049BB133111EB
+         ^ z2 * 0x2545F4914F6CDD1D ^ world_seed * 0xD6E8FEB86659FD93) & MASK64
+    )
+    return (h >> 11) * INV_2_53, (_splitmix64(h) >> 11) * INV_2_53
+
+
+# Reseeded for one-off seeded rolls instead of building a new
+# random.Random each time (World is only used from the game thread)
+_scratch_rng = random.Random()
+
+# Doorway generators. Worlds saved before doorways were hashed with
+# SplitMix64 keep rolling them with random.Random, so their layout holds.
+DOORWAY_RNG_LEGACY = "random"
+DOORWAY_RNG = "splitmix64"
+
+# Marks a cache miss where None is a valid cached value
+_UNCACHED = object()
+
+# Offset that makes signed grid indices non-negative before packing
+CELL_BIAS = 1 << 31
+CELL_MASK = (1 << 32) - 1
+PILLAR_OFFSET = PILLAR_SPACING // 2
+
+
+def _cell_key(gx, gz):
+    """
+    Pack grid cell indices into a single int key (exact for |g| < 2**31).
+    Cells next to each other along z get consecutive keys.
+    """
+    return ((gx + CELL_BIAS) << 32) | (gz + CELL_BIAS)
+
+
+def _cell_from_key(key):
+    """Grid cell indices of a _cell_key."""
+    return (key >> 32) - CELL_BIAS, (key & CELL_MASK) - CELL_BIAS
+
+
+def _wall_code(x1, z1, x2, z2):
+    """
+    wall_cache key for the grid edge between two sorted grid points: the
+    _cell_key of its lower corner cell, with the low bit set for walls
+    running along z. None if the points aren't one grid edge apart.
+    """
+    if x1 % PILLAR_SPACING or z1 % PILLAR_SPACING:
+        return None
+    if z1 == z2 and x2 - x1 == PILLAR_SPACING:
+        vertical = 0
+    elif x1 == x2 and z2 - z1 == PILLAR_SPACING:
+        vertical = 1
+    else:
+        return None
+    return (_cell_key(int(x1 // PILLAR_SPACING), int(z1 // PILLAR_SPACING)) << 1) | vertical
+
+
+def make_wall_key(x1, z1, x2, z2):
+    """Wall key ((x1, z1), (x2, z2)) for two grid points, in sorted order."""
+    if x2 < x1 or (x2 == x1 and z2 < z1):
+        return ((x2, z2), (x1, z1))
+    return ((x1, z1), (x2, z2))
+
+
+def _sorted_wall_code(x1, z1, x2, z2):
+    """_wall_code of the edge between two grid points given in either order."""
+    if x2 < x1 or (x2 == x1 and z2 < z1):
+        return _wall_code(x2, z2, x1, z1)
+    return _wall_code(x1, z1, x2, z2)
+
+
+def _wall_key_code(wall_key):
+    """_wall_code of a wall key ((x1, z1), (x2, z2)), with its points in either order."""
+    (x1, z1), (x2, z2) = wall_key
+    return _sorted_wall_code(x1, z1, x2, z2)
+
+
+def _wall_from_code(code):
+    """Sorted wall key ((x1, z1), (x2, z2)) of a _wall_code."""
+    gx, gz = _cell_from_key(code >> 1)
+    x1 = gx * PILLAR_SPACING
+    z1 = gz * PILLAR_SPACING
+    if code & 1:
+        return ((x1, z1), (x1, z1 + PILLAR_SPACING))
+    return ((x1, z1), (x1 + PILLAR_SPACING, z1))
+
+
+def _pillar_code(px, pz):
+    """pillar_cache key for a pillar position, or None if it's off the pillar grid."""
+    if px % PILLAR_SPACING != PILLAR_OFFSET or pz % PILLAR_SPACING != PILLAR_OFFSET:
+        return None
+    return _cell_key(int(px // PILLAR_SPACING), int(pz // PILLAR_SPACING))
+
+
+def _pillar_from_code(code):
+    """Pillar position (x, z) of a _pillar_code."""
+    gx, gz = _cell_from_key(code)
+    return (gx * PILLAR_SPACING + PILLAR_OFFSET, gz * PILLAR_SPACING + PILLAR_OFFSET)
+
+
+# Blanks out the tuple syntax of str() keys, leaving only the numbers
+_KEY_PUNCTUATION = str.maketrans('(),', '   ')
+
+
+def _parse_key(k_str):
+    """
+    Parse a str() key from older saves, '((x1, z1), (x2, z2))' or '(x, z)',
+    without eval().
+    """
+    nums = [float(n) if '.' in n else int(n) for n in k_str.translate(_KEY_PUNCTUATION).split()]
+    if len(nums) == 4:
+        return ((nums[0], nums[1]), (nums[2], nums[3]))
+    return tuple(nums)
+
+
+def _wall_columns(walls, value_column, convert=None):
+    """Split a _wall_code -> value dict into parallel x1/z1/x2/z2/value columns."""
+    starts, ends = zip(*map(_wall_from_code, walls)) if walls else ((), ())
+    x1, z1 = zip(*starts) if starts else ((), ())
+    x2, z2 = zip(*ends) if ends else ((), ())
+    values = walls.values() if convert is None else map(convert, walls.values())
+    return {'x1': x1, 'z1': z1, 'x2': x2, 'z2': z2, value_column: list(values)}
+
+
+def _str_key_entries(data):
+    """(_wall_code, value) pairs of a dict keyed by str(wall_key), as in version 1.1 saves."""
+    return ((_wall_key_code(_parse_key(k)), v) for k, v in data.items())
+
+
+def _wall_entries(data, value_column):
+    """
+    (_wall_code, value) pairs of a saved wall field: columns written by
+    _wall_columns, or a dict keyed by str(wall_key) in version 1.1 saves.
+    """
+    if value_column in data:
+        return zip(map(_wall_code, data['x1'], data['z1'], data['x2'], data['z2']), data[value_column])
+    return _str_key_entries(data)
+
+
+def _quantize_health(health):
+    """Float wall health (1.0 = full) as wall_health units."""
+    return min(max(round(health * WALL_HEALTH_SCALE), 0), 255)
+
+
+def _quantize_crack(u, v, angle, length):
+    """Float crack (u, v, angle, length) as the int tuple kept in wall_cracks."""
+    return (round(u * CRACK_UV_SCALE), round(v * CRACK_UV_SCALE),
+            min(round(angle * CRACK_ANGLE_SCALE), 255), min(round(length * CRACK_LENGTH_SCALE), 255))
+
+
+def _dequantize_crack(crack):
+    """Float (u, v, angle, length) of a quantized crack."""
+    u, v, angle, length = crack
+    return (u / CRACK_UV_SCALE, v / CRACK_UV_SCALE,
+            angle / CRACK_ANGLE_SCALE, length / CRACK_LENGTH_SCALE)
+
+
+class WallRecord(namedtuple('WallRecord', ['code', 'opening_type', 'opening_start', 'opening_end'])):
+    """
+    Fused result of has_wall_between + get_doorway_type for one wall. The
+    opening runs along the wall (x for horizontal walls, z for vertical ones);
+    a solid wall has opening_start == opening_end. Destruction is not part of
+    the record - ask World.is_wall_record_destroyed / wall_state_of.
+    """
+
+    __slots__ = ()
+
+    @property
+    def key(self):
+        """Sorted wall key ((x1, z1), (x2, z2)), derived from code."""
+        return _wall_from_code(self.code)
+
+
+class CellBitset:
+    """
+    Map of cell keys (_cell_key) to bools, for the lazily filled map caches.
+
+    Cells are grouped into 8x8 blocks, each stored as two ints - which
+    cells are known, and their values - so a neighbourhood of 64 cells
+    costs two dict entries instead of 64. Supports the dict operations the
+    caches use. With layered=True keys carry an extra low bit (wall
+    orientation, as in _wall_code) that selects a separate set of blocks.
+
+    A lookup costs more than a dict hit, but the hot paths read
+    _wall_records and _collision_grid instead; this only pays for memory.
+    """
+
+    def __init__(self, layered=False):
+        self.layered = layered
+        self._known = {}  # block -> bit per cell that has been cached
+        self._bits = {}   # block -> bit per cell whose value is True
+        self._count = 0
+
+    def _locate(self, key):
+        """Block key and bit mask of a cell key."""
+        layer = 0
+        if self.layered:
+            layer = key & 1
+            key >>= 1
+        hi = key >> 32          # biased gx
+        lo = key & CELL_MASK    # biased gz
+        block = ((((hi >> 3) << 29) | (lo >> 3)) << 1) | layer
+        return block, 1 << (((hi & 7) << 3) | (lo & 7))
+
+    def get(self, key, default=None):
+        block, mask = self._locate(key)
+        if not self._known.get(block, 0) & mask:
+            return default
+        return bool(self._bits[block] & mask)
+
+    def __contains__(self, key):
+        block, mask = self._locate(key)
+        return bool(self._known.get(block, 0) & mask)
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        block, mask = self._locate(key)
+        known = self._known.get(block, 0)
+        if not known & mask:
+            self._known[block] = known | mask
+            self._count += 1
+        bits = self._bits.get(block, 0)
+        self._bits[block] = (bits | mask) if value else (bits & ~mask)
+
+    def __len__(self):
+        return self._count
+
+    def items(self):
+        """(key, value) for every cached cell, block by block."""
+        for block, known in self._known.items():
+            bits = self._bits[block]
+            layer = block & 1
+            hi_base = (block >> 30) << 3
+            lo_base = ((block >> 1) & 0x1FFFFFFF) << 3
+            while known:
+                low = known & -known
+                i = low.bit_length() - 1
+                key = ((hi_base | (i >> 3)) << 32) | lo_base | (i & 7)
+                if self.layered:
+                    key = (key << 1) | layer
+                yield key, bool(bits & low)
+                known ^= low
+
+    def __iter__(self):
+        return (key for key, _ in self.items())
+
+    def values(self):
+        return (value for _, value in self.items())
+
+
+def _rebuild_wall_cache(x1, z1, x2, z2, exists):
+    """Rebuild a wall_cache from its saved x1/z1/x2/z2/exists columns."""
+    cache = CellBitset(layered=True)
+    for code, e in zip(map(_wall_code, x1, z1, x2, z2), exists):
+        if code is not None:
+            cache[code] = e
+    return cache
+
+
+def _rebuild_pillar_cache(xs, zs, exists):
+    """Rebuild a pillar_cache from its saved x/z/exists columns."""
+    cache = CellBitset()
+    for code, e in zip(map(_pillar_code, xs, zs), exists):
+        if code is not None:
+            cache[code] = e
+    return cache
+
 
 class WallState(Enum):
     """Progressive damage states for walls."""
@@ -30,6 +373,13 @@ class WallState(Enum):
     DESTROYED = auto()   # Gone, only debris remains
 
 
+# wall_states holds WallState values as plain ints
+_WS_INTACT = WallState.INTACT.value
+_WS_CRACKED = WallState.CRACKED.value
+_WS_FRACTURED = WallState.FRACTURED.value
+_WS_DESTROYED = WallState.DESTROYED.value
+
+
 class World:
     """World state and procedural queries."""
 
@@ -37,27 +387,41 @@ class World:
         self.world_seed = world_seed if world_seed is not None else random.randint(0, 999999)
 
         # Caches - THESE ARE NOW SAVED TO PRESERVE MAP LAYOUT
-        self.pillar_cache = {}  # (x, z) -> bool
-        self.wall_cache = {}    # tuple(sorted([(x1,z1), (x2,z2)])) -> bool
+        self.pillar_cache = CellBitset()              # _pillar_code(x, z) -> bool
+        self.wall_cache = CellBitset(layered=True)    # _wall_code of the sorted endpoints -> bool
         self.zone_cache = {}
         self.lamp_cache = {}
+        self.doorway_rng = DOORWAY_RNG
+        self._wall_records = {}   # _wall_code -> WallRecord, or None for no wall
         self.trap_cache = {}
 
-        # Destruction state
-        self.destroyed_walls = set()
+        # Destruction state. Wall bookkeeping is keyed by _wall_code ints;
+        # the public methods below take ((x1, z1), (x2, z2)) wall keys.
+        self.destroyed_walls = set()    # _wall_code
         self.destroyed_pillars = set()
         self.destroyed_lamps = set()
         self.triggered_traps = set()
-        self.pre_damaged_walls = {}  # wall_key -> damage_state (0.0-1.0)
+        self.pre_damaged_walls = {}  # _wall_code -> damage_state (0.0-1.0)
 
         # Progressive wall damage system
-        self.wall_states = {}   # wall_key -> WallState
-        self.wall_health = {}   # wall_key -> float (0.0 to 1.0)
-        self.wall_cracks = {}   # wall_key -> list of (u, v, angle, length) tuples
+        self.wall_states = {}   # _wall_code -> WallState value (int)
+        self.wall_health = {}   # _wall_code -> int (0 to WALL_HEALTH_SCALE)
+        self.wall_cracks = {}   # _wall_code -> list of _quantize_crack tuples
 
         # Debris
-        self.debris_pieces = []
+        self._debris_rng = np.random.default_rng()
+        self.debris = DebrisField(MAX_DEBRIS, rng=self._debris_rng)
         self._spawned_rubble = set()
+        self._debris_cull_cell = None   # player cell at the last distance cull
+        self._debris_cull_frames = 0
+
+        # Scaled wall height and floor level, polled once per frame by
+        # update_debris for the debris spawners and physics
+        self._wall_h = get_scaled_wall_height()
+        self._floor_y = get_scaled_floor_y()
+
+        # Collision broad phase: _cell_key -> standing segments of the cell
+        self._collision_grid = {}
 
         print(f"World seed: {self.world_seed}")
 
@@ -80,18 +444,15 @@ class World:
 
     def has_pillar_at(self, px, pz):
         """Check if there's a pillar at this position."""
-        key = (px, pz)
-        if key in self.pillar_cache:
-            return self.pillar_cache[key]
-
-        if PILLAR_MODE == "none":
-            self.pillar_cache[key] = False
+        key = _pillar_code(px, pz)
+        if key is None:
+            # Not on the pillar grid
             return False
+        cached = self.pillar_cache.get(key)
+        if cached is not None:
+            return cached
 
-        offset = PILLAR_SPACING // 2
-        is_on_pillar_grid = (px % PILLAR_SPACING == offset) and (pz % PILLAR_SPACING == offset)
-
-        if not is_on_pillar_grid:
+        if PILLAR_MODE == "none":
             self.pillar_cache[key] = False
             return False
 
@@ -101,7 +462,8 @@ class World:
 
         # Deterministic random based on position
         seed = hash((px, pz, self.world_seed)) % 100000
-        rng = random.Random(seed)
+        rng = _scratch_rng
+        rng.seed(seed)
 
         probability_map = {
             "sparse": 0.10,
@@ -123,49 +485,71 @@ class World:
 
     def has_wall_between(self, x1, z1, x2, z2):
         """Check if there's a wall between two grid points."""
-        key = tuple(sorted([(x1, z1), (x2, z2)]))
+        cache_key = _sorted_wall_code(x1, z1, x2, z2)
 
-        if key in self.wall_cache:
-            return self.wall_cache[key]
+        if cache_key is not None:
+            cached = self.wall_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         is_horizontal = (z1 == z2)
         is_vertical = (x1 == x2)
 
         if not (is_horizontal or is_vertical):
-            self.wall_cache[key] = False
             return False
 
+        if cache_key is None:
+            # Not a single grid edge, so there's no wall state to track
+            return True
+
         # Check for pre-existing damage
-        if key not in self.pre_damaged_walls:
+        if cache_key not in self.pre_damaged_walls:
             zone = self.get_zone_at((x1 + x2) / 2, (z1 + z2) / 2)
-            props = self.get_zone_properties(*zone)
+            decay_chance = self.get_zone_properties(*zone)['decay_chance']
 
-            # Deterministic decay check
-            decay_seed = int(x1 * 7919 + z1 * 6577 + x2 * 4993 + z2 * 3571 + self.world_seed * 9973)
-            rng = random.Random(decay_seed)
+            # Deterministic decay check (rolls are in [0, 1), so zones
+            # without decay can skip them)
+            if decay_chance > 0.0:
+                (x1, z1), (x2, z2) = _wall_from_code(cache_key)
+                decay_roll, damage_roll = _wall_decay_rolls(x1, z1, x2, z2, self.world_seed)
 
-            if rng.random() < props['decay_chance']:
-                damage = rng.uniform(0.0, 0.5)
-                self.pre_damaged_walls[key] = damage
+                if decay_roll < decay_chance:
+                    damage = damage_roll * 0.5
+                    self.pre_damaged_walls[cache_key] = damage
 
-                # Fully destroyed
-                if damage < 0.2:
-                    self.destroyed_walls.add(key)
+                    # Fully destroyed
+                    if damage < 0.2:
+                        self.destroyed_walls.add(cache_key)
 
         has_wall = True
-        self.wall_cache[key] = has_wall
+        self.wall_cache[cache_key] = has_wall
         return has_wall
 
     def is_wall_destroyed(self, wall_key):
         """Check if a wall has been destroyed."""
-        return wall_key in self.destroyed_walls
+        return _wall_key_code(wall_key) in self.destroyed_walls
+
+    def is_wall_record_destroyed(self, record):
+        """is_wall_destroyed for a WallRecord."""
+        return record.code in self.destroyed_walls
+
+    def destroyed_wall_keys(self):
+        """Destroyed walls as wall keys. Builds a new set - O(N) per call."""
+        return set(map(_wall_from_code, self.destroyed_walls))
 
     def get_wall_damage(self, wall_key):
         """Get damage state for a wall (1.0 = intact, 0.0 = rubble)."""
-        return self.pre_damaged_walls.get(wall_key, 1.0)
+        return self.pre_damaged_walls.get(_wall_key_code(wall_key), 1.0)
+
+    def wall_damage_of(self, record):
+        """get_wall_damage for a WallRecord."""
+        return self.pre_damaged_walls.get(record.code, 1.0)
 
     def get_doorway_type(self, x1, z1, x2, z2):
-        """Determine if a wall has a doorway or hallway."""
+        """
+        Determine if a wall has a doorway or hallway.
+        Not cached - get_wall_record keeps the result in the wall's record.
+        """
         is_horizontal = (z1 == z2)
 
         if is_horizontal:
@@ -173,73 +557,119 @@ class World:
         else:
             door_seed = int(x1 * 3571 + ((z1 + z2) // 2) * 2897 + self.world_seed * 9973)
 
-        rng = random.Random(door_seed)
-        roll = rng.random()
+        if self.doorway_rng == DOORWAY_RNG_LEGACY:
+            _scratch_rng.seed(door_seed)
+            roll = _scratch_rng.random()
+        else:
+            roll = (_splitmix64(door_seed & MASK64) >> 11) * INV_2_53
 
         if roll < 0.3:
             return "hallway"
         elif roll < 0.5:
             return "doorway"
-        else:
+        return None
+
+    def get_wall_record(self, x1, z1, x2, z2):
+        """
+        Wall between two grid points as a WallRecord, or None if there is none.
+
+        One dict hit replaces the has_wall_between / get_doorway_type pair
+        on hot paths. Records are built on first touch and never change,
+        since destruction is kept out of them. Only single grid edges have
+        records.
+        """
+        code = _sorted_wall_code(x1, z1, x2, z2)
+        if code is None:
             return None
+        record = self._wall_records.get(code, _UNCACHED)
+        if record is not _UNCACHED:
+            return record
+
+        record = None
+        if self.has_wall_between(x1, z1, x2, z2):
+            (x1, z1), (x2, z2) = _wall_from_code(code)
+            opening_type = self.get_doorway_type(x1, z1, x2, z2)
+            if opening_type == "hallway":
+                opening_width = HALLWAY_WIDTH
+            elif opening_type == "doorway":
+                opening_width = 60
+            else:
+                opening_width = 0
+
+            start = x1 if z1 == z2 else z1
+            length = (x2 - x1) + (z2 - z1)
+            opening_start = start + (length - opening_width) / 2
+            record = WallRecord(code, opening_type, opening_start, opening_start + opening_width)
+
+        self._wall_records[code] = record
+        return record
 
     # === PROGRESSIVE WALL DAMAGE ===
 
     def get_wall_state(self, wall_key):
         """Get current damage state of a wall."""
-        if wall_key in self.destroyed_walls:
+        return self._wall_state_by_code(_wall_key_code(wall_key))
+
+    def wall_state_of(self, record):
+        """get_wall_state for a WallRecord."""
+        return self._wall_state_by_code(record.code)
+
+    def _wall_state_by_code(self, code):
+        if code in self.destroyed_walls:
             return WallState.DESTROYED
-        return self.wall_states.get(wall_key, WallState.INTACT)
+        return WallState(self.wall_states.get(code, _WS_INTACT))
 
     def get_wall_health(self, wall_key):
         """Get wall health (1.0 = full, 0.0 = destroyed)."""
-        if wall_key in self.destroyed_walls:
+        code = _wall_key_code(wall_key)
+        if code in self.destroyed_walls:
             return 0.0
-        return self.wall_health.get(wall_key, 1.0)
+        return self.wall_health.get(code, WALL_HEALTH_SCALE) / WALL_HEALTH_SCALE
 
     def get_wall_cracks(self, wall_key):
         """Get crack data for rendering."""
-        return self.wall_cracks.get(wall_key, [])
+        return [_dequantize_crack(crack) for crack in self.wall_cracks.get(_wall_key_code(wall_key), ())]
 
     def _get_wall_center(self, wall_key):
         """Get world position of wall center."""
         (x1, z1), (x2, z2) = wall_key
-        h = get_scaled_wall_height()
-        floor_y = get_scaled_floor_y()
+        h = self._wall_h
+        floor_y = self._floor_y
         return (
             (x1 + x2) / 2,
             (floor_y + h) / 2,
             (z1 + z2) / 2
         )
 
-    def _add_crack(self, wall_key, hit_u=None, hit_v=None):
+    def _add_crack(self, code, hit_u=None, hit_v=None):
         """Add a crack at hit position (or random if not specified)."""
-        if wall_key not in self.wall_cracks:
-            self.wall_cracks[wall_key] = []
+        if code not in self.wall_cracks:
+            self.wall_cracks[code] = []
 
         u = hit_u if hit_u is not None else random.uniform(0.1, 0.9)
         v = hit_v if hit_v is not None else random.uniform(0.1, 0.9)
         angle = random.uniform(0, math.pi)
         length = random.uniform(0.1, 0.4)
 
-        self.wall_cracks[wall_key].append((u, v, angle, length))
+        self.wall_cracks[code].append(_quantize_crack(u, v, angle, length))
 
     def hit_wall(self, wall_key, damage=0.25):
         """
         Apply damage to a wall (progressive destruction).
         Returns True if wall was destroyed.
         """
-        if wall_key in self.destroyed_walls:
+        code = _wall_key_code(wall_key)
+        if code is None or code in self.destroyed_walls:
             return False
 
         # Initialize health if needed
-        if wall_key not in self.wall_health:
-            self.wall_health[wall_key] = 1.0
-            self.wall_states[wall_key] = WallState.INTACT
+        if code not in self.wall_health:
+            self.wall_health[code] = WALL_HEALTH_SCALE
+            self.wall_states[code] = _WS_INTACT
 
         # Apply damage
-        self.wall_health[wall_key] -= damage
-        health = self.wall_health[wall_key]
+        self.wall_health[code] = max(self.wall_health[code] - round(damage * WALL_HEALTH_SCALE), 0)
+        health = self.wall_health[code] / WALL_HEALTH_SCALE
 
         # Get position for event
         position = self._get_wall_center(wall_key)
@@ -247,35 +677,38 @@ class World:
         # State transitions based on health
         if health <= 0.0:
             # DESTROYED
-            self.destroyed_walls.add(wall_key)
-            self.wall_states[wall_key] = WallState.DESTROYED
+            self.destroyed_walls.add(code)
+            self.wall_states[code] = _WS_DESTROYED
+            self._invalidate_collision(*_cell_from_key(code >> 1))
             self.spawn_wall_debris(wall_key)
             event_bus.emit(EventType.WALL_DESTROYED, wall_key=wall_key, position=position)
             return True
 
-        elif health <= 0.33 and self.wall_states[wall_key] != WallState.FRACTURED:
+        elif health <= 0.33 and self.wall_states[code] != _WS_FRACTURED:
             # FRACTURED
-            self.wall_states[wall_key] = WallState.FRACTURED
-            self._add_crack(wall_key)
-            self._add_crack(wall_key)
+            self.wall_states[code] = _WS_FRACTURED
+            self._add_crack(code)
+            self._add_crack(code)
             event_bus.emit(EventType.WALL_FRACTURED, wall_key=wall_key, position=position)
 
-        elif health <= 0.66 and self.wall_states[wall_key] == WallState.INTACT:
+        elif health <= 0.66 and self.wall_states[code] == _WS_INTACT:
             # CRACKED
-            self.wall_states[wall_key] = WallState.CRACKED
-            self._add_crack(wall_key)
+            self.wall_states[code] = _WS_CRACKED
+            self._add_crack(code)
             event_bus.emit(EventType.WALL_CRACKED, wall_key=wall_key, position=position)
 
         return False
 
     def destroy_wall(self, wall_key, destroy_sound):
         """Instantly destroy a wall (bypasses progressive damage)."""
-        if wall_key in self.destroyed_walls:
+        code = _wall_key_code(wall_key)
+        if code is None or code in self.destroyed_walls:
             return
 
-        self.destroyed_walls.add(wall_key)
-        self.wall_states[wall_key] = WallState.DESTROYED
-        self.wall_health[wall_key] = 0.0
+        self.destroyed_walls.add(code)
+        self.wall_states[code] = _WS_DESTROYED
+        self.wall_health[code] = 0
+        self._invalidate_collision(*_cell_from_key(code >> 1))
 
         position = self._get_wall_center(wall_key)
         self.spawn_wall_debris(wall_key)
@@ -287,41 +720,31 @@ class World:
     def spawn_wall_debris(self, wall_key):
         """Spawn debris particles for a destroyed wall."""
         (x1, z1), (x2, z2) = wall_key
-        h = get_scaled_wall_height()
-        floor_y = get_scaled_floor_y()
+        h = self._wall_h
+        floor_y = self._floor_y
 
         cx = (x1 + x2) / 2
         cz = (z1 + z2) / 2
 
-        # Spawn debris particles
-        for _ in range(150):
-            offset_x = random.uniform(-PILLAR_SPACING/2, PILLAR_SPACING/2)
-            offset_z = random.uniform(-WALL_THICKNESS, WALL_THICKNESS)
-            py = random.uniform(floor_y, h)
-
-            vx = random.uniform(-10, 10)
-            vy = random.uniform(-5, 5)
-            vz = random.uniform(-10, 10)
-
-            color_var = random.randint(-40, 20)
-            particle_color = (
-                max(0, min(255, WALL_COLOR[0] + color_var)),
-                max(0, min(255, WALL_COLOR[1] + color_var)),
-                max(0, min(255, WALL_COLOR[2] + color_var))
-            )
+        # Spawn debris particles, generated as one batch
+        n = 150
+        rng = self._debris_rng
+        offset_along = rng.uniform(-PILLAR_SPACING/2, PILLAR_SPACING/2, n)
+        offset_across = rng.uniform(-WALL_THICKNESS, WALL_THICKNESS, n)
+        py = rng.uniform(floor_y, h, n)
+        velocities = rng.uniform((-10, -5, -10), (10, 5, 10), (n, 3))
+
+        color_var = rng.integers(-40, 21, (n, 1))
+        colors = np.clip(np.array(WALL_COLOR) + color_var, 0, 255)
 
-            if x1 == x2:  # Vertical wall
-                px = cx + offset_z
-                pz = cz + offset_x
-            else:  # Horizontal wall
-                px = cx + offset_x
-                pz = cz + offset_z
+        if x1 == x2:  # Vertical wall
+            px = cx + offset_across
+            pz = cz + offset_along
+        else:  # Horizontal wall
+            px = cx + offset_along
+            pz = cz + offset_across
 
-            self.debris_pieces.append(Debris(
-                (px, py, pz),
-                particle_color,
-                velocity=(vx, vy, vz)
-            ))
+        self.debris.spawn(np.column_stack((px, py, pz)), colors, velocities)
 
     def destroy_pillar(self, pillar_key, destroy_sound):
         """Destroy a pillar."""
@@ -330,37 +753,29 @@ class World:
 
         self.destroyed_pillars.add(pillar_key)
         px, pz = pillar_key
-        h = get_scaled_wall_height()
-        floor_y = get_scaled_floor_y()
+        self._invalidate_collision(int(px // PILLAR_SPACING), int(pz // PILLAR_SPACING))
+        h = self._wall_h
+        floor_y = self._floor_y
         position = (px + PILLAR_SIZE/2, (floor_y + h)/2, pz + PILLAR_SIZE/2)
 
-        # Spawn debris
-        for _ in range(200):
-            offset_x = random.uniform(0, PILLAR_SIZE)
-            offset_z = random.uniform(0, PILLAR_SIZE)
-            py = random.uniform(floor_y, h)
-
-            dx = (px + PILLAR_SIZE/2) - (px + offset_x)
-            dz = (pz + PILLAR_SIZE/2) - (pz + offset_z)
-            dist = math.sqrt(dx ** 2 + dz ** 2) + 0.1
-
-            speed = random.uniform(8, 20)
-            vx = (dx / dist) * speed + random.uniform(-3, 3)
-            vy = random.uniform(-20, -5)
-            vz = (dz / dist) * speed + random.uniform(-3, 3)
-
-            color_var = random.randint(-30, 30)
-            particle_color = (
-                max(0, min(255, PILLAR_COLOR[0] + color_var)),
-                max(0, min(255, PILLAR_COLOR[1] + color_var)),
-                max(0, min(255, PILLAR_COLOR[2] + color_var))
-            )
+        # Spawn debris, blasted outwards from the pillar's center
+        n = 200
+        rng = self._debris_rng
+        offsets = rng.uniform(0, PILLAR_SIZE, (n, 2))
+        py = rng.uniform(floor_y, h, n)
+
+        d_xz = PILLAR_SIZE/2 - offsets
+        dist = np.hypot(d_xz[:, 0], d_xz[:, 1]) + 0.1
+        speed = rng.uniform(8, 20, n)
+        v_xz = d_xz * (speed / dist)[:, None] + rng.uniform(-3, 3, (n, 2))
+        vy = rng.uniform(-20, -5, n)
+
+        color_var = rng.integers(-30, 31, (n, 1))
+        colors = np.clip(np.array(PILLAR_COLOR) + color_var, 0, 255)
 
-            self.debris_pieces.append(Debris(
-                (px, py, pz),
-                particle_color,
-                velocity=(vx, vy, vz)
-            ))
+        positions = np.column_stack((np.full(n, px), py, np.full(n, pz)))
+        velocities = np.column_stack((v_xz[:, 0], vy, v_xz[:, 1]))
+        self.debris.spawn(positions, colors, velocities)
 
         event_bus.emit(EventType.PILLAR_DESTROYED,
                       pillar_key=pillar_key, position=position)
@@ -370,14 +785,14 @@ class World:
 
     def spawn_rubble_pile(self, x1, z1, x2, z2):
         """Spawn a persistent rubble pile for pre-destroyed walls."""
-        wall_key = tuple(sorted([(x1, z1), (x2, z2)]))
+        code = _sorted_wall_code(x1, z1, x2, z2)
 
-        if wall_key in self._spawned_rubble:
+        if code in self._spawned_rubble:
             return
 
-        self._spawned_rubble.add(wall_key)
+        self._spawned_rubble.add(code)
 
-        floor_y = get_scaled_floor_y()
+        floor_y = self._floor_y
         half_thick = WALL_THICKNESS / 2
 
         if x1 == x2:
@@ -388,50 +803,121 @@ class World:
             min_z, max_z = z1 - half_thick, z1 + half_thick
 
         # Spawn settled debris
-        for _ in range(80):
-            px = random.uniform(min_x, max_x)
-            pz = random.uniform(min_z, max_z)
-
-            color_var = random.randint(-40, 20)
-            particle_color = (
-                max(0, min(255, 200 + color_var)),
-                max(0, min(255, 180 + color_var)),
-                max(0, min(255, 160 + color_var))
-            )
+        n = 80
+        rng = self._debris_rng
+        px = rng.uniform(min_x, max_x, n)
+        pz = rng.uniform(min_z, max_z, n)
+
+        color_var = rng.integers(-40, 21, (n, 1))
+        colors = np.clip(np.array((200, 180, 160)) + color_var, 0, 255)
 
-            self.debris_pieces.append(Debris(
-                (px, floor_y, pz),
-                particle_color,
-                velocity=None  # Settled from the start
-            ))
+        self.debris.spawn(
+            np.column_stack((px, np.full(n, floor_y), pz)), colors,
+            velocities=None  # Settled from the start
+        )
 
     # === DEBRIS UPDATE ===
 
     def update_debris(self, dt, player_x, player_z):
         """Update all debris particles."""
-        floor_y = get_scaled_floor_y()
-        MAX_DEBRIS = 12000
-        DEBRIS_CULL_DIST = 900.0
+        self._wall_h = get_scaled_wall_height()
+        self._floor_y = get_scaled_floor_y()
+        self.debris.update(dt, self._floor_y)
+
+        # Cull distant debris when the player enters a new cell, or every
+        # DEBRIS_CULL_INTERVAL frames - far pieces can linger a little,
+        # they're out of view anyway. Then trim dead slots off the end
+        # (the hard cap is enforced by DebrisField.spawn).
+        cell = (int(player_x // PILLAR_SPACING), int(player_z // PILLAR_SPACING))
+        self._debris_cull_frames += 1
+        if cell != self._debris_cull_cell or self._debris_cull_frames >= DEBRIS_CULL_INTERVAL:
+            self.debris.cull(player_x, player_z, DEBRIS_CULL_DIST)
+            self._debris_cull_cell = cell
+            self._debris_cull_frames = 0
+        self.debris.trim()
 
-        for d in self.debris_pieces:
-            d.update(dt, floor_y)
-            if not d.active:
-                continue
-
-            # Cull distant debris
-            dx = d.cx - player_x
-            dz = d.cz - player_z
-            if (dx * dx + dz * dz) > (DEBRIS_CULL_DIST * DEBRIS_CULL_DIST):
-                d.active = False
+    # === COLLISION QUERIES ===
 
-        # Remove inactive debris
-        self.debris_pieces = [d for d in self.debris_pieces if d.active]
+    def collision_segments(self, gx, gz):
+        """
+        Standing wall and pillar segments of grid cell (gx, gz).
 
-        # Enforce hard cap
-        if len(self.debris_pieces) > MAX_DEBRIS:
-            self.debris_pieces = self.debris_pieces[-MAX_DEBRIS:]
+        Covers the horizontal and vertical wall starting at the cell corner
+        and the cell's pillar, as (x1, z1, x2, z2) tuples with doorway
+        openings already cut out. Built on first use and cached until
+        something in the cell is destroyed (see _invalidate_collision).
+        """
+        cell_key = _cell_key(gx, gz)
+        segments = self._collision_grid.get(cell_key)
+        if segments is not None:
+            return segments
 
-    # === COLLISION QUERIES ===
+        segments = []
+        append = segments.append
+        half_thick = WALL_THICKNESS / 2
+        px = gx * PILLAR_SPACING
+        pz = gz * PILLAR_SPACING
+
+        # Horizontal wall. Destruction is checked after the record is built,
+        # since building it can pre-destroy a decayed wall.
+        record = self.get_wall_record(px, pz, px + PILLAR_SPACING, pz)
+        if record is not None and record.code not in self.destroyed_walls:
+            wall_z = pz
+            wall_x_start = px
+            wall_x_end = px + PILLAR_SPACING
+
+            if record.opening_type is not None:
+                # Wall with opening - segments on both sides + doorway edges
+                opening_start = record.opening_start
+                opening_end = record.opening_end
+                append((wall_x_start, wall_z - half_thick, opening_start, wall_z - half_thick))
+                append((wall_x_start, wall_z + half_thick, opening_start, wall_z + half_thick))
+                append((opening_end, wall_z - half_thick, wall_x_end, wall_z - half_thick))
+                append((opening_end, wall_z + half_thick, wall_x_end, wall_z + half_thick))
+                append((opening_start, wall_z - half_thick, opening_start, wall_z + half_thick))
+                append((opening_end, wall_z - half_thick, opening_end, wall_z + half_thick))
+            else:
+                append((wall_x_start, wall_z - half_thick, wall_x_end, wall_z - half_thick))
+                append((wall_x_start, wall_z + half_thick, wall_x_end, wall_z + half_thick))
+
+        # Vertical wall (same logic, rotated)
+        record = self.get_wall_record(px, pz, px, pz + PILLAR_SPACING)
+        if record is not None and record.code not in self.destroyed_walls:
+            wall_x = px
+            wall_z_start = pz
+            wall_z_end = pz + PILLAR_SPACING
+
+            if record.opening_type is not None:
+                opening_start = record.opening_start
+                opening_end = record.opening_end
+                append((wall_x - half_thick, wall_z_start, wall_x - half_thick, opening_start))
+                append((wall_x + half_thick, wall_z_start, wall_x + half_thick, opening_start))
+                append((wall_x - half_thick, opening_end, wall_x - half_thick, wall_z_end))
+                append((wall_x + half_thick, opening_end, wall_x + half_thick, wall_z_end))
+                append((wall_x - half_thick, opening_start, wall_x + half_thick, opening_start))
+                append((wall_x - half_thick, opening_end, wall_x + half_thick, opening_end))
+            else:
+                append((wall_x - half_thick, wall_z_start, wall_x - half_thick, wall_z_end))
+                append((wall_x + half_thick, wall_z_start, wall_x + half_thick, wall_z_end))
+
+        # Pillar - four sides
+        offset = PILLAR_SPACING // 2
+        pillar_x = px + offset
+        pillar_z = pz + offset
+        if self.has_pillar_at(pillar_x, pillar_z) and (pillar_x, pillar_z) not in self.destroyed_pillars:
+            s = PILLAR_SIZE
+            append((pillar_x, pillar_z, pillar_x + s, pillar_z))
+            append((pillar_x + s, pillar_z, pillar_x + s, pillar_z + s))
+            append((pillar_x + s, pillar_z + s, pillar_x, pillar_z + s))
+            append((pillar_x, pillar_z + s, pillar_x, pillar_z))
+
+        segments = tuple(segments)
+        self._collision_grid[cell_key] = segments
+        return segments
+
+    def _invalidate_collision(self, gx, gz):
+        """Drop the cached collision segments of grid cell (gx, gz)."""
+        self._collision_grid.pop(_cell_key(gx, gz), None)
 
     def check_collision(self, x, z):
         """Check if a position collides with walls."""
@@ -439,141 +925,112 @@ class World:
             return True
 
         player_radius = 15.0
-        half_thick = WALL_THICKNESS / 2
-        check_range = PILLAR_SPACING * 2
-        
-        min_grid_x = int((x - check_range) // PILLAR_SPACING) * PILLAR_SPACING
-        max_grid_x = int((x + check_range) // PILLAR_SPACING) * PILLAR_SPACING
-        min_grid_z = int((z - check_range) // PILLAR_SPACING) * PILLAR_SPACING
-        max_grid_z = int((z + check_range) // PILLAR_SPACING) * PILLAR_SPACING
-
-        for px_grid in range(min_grid_x, max_grid_x + PILLAR_SPACING, PILLAR_SPACING):
-            for pz_grid in range(min_grid_z, max_grid_z + PILLAR_SPACING, PILLAR_SPACING):
-
-                # Check horizontal wall
-                if self.has_wall_between(px_grid, pz_grid, px_grid + PILLAR_SPACING, pz_grid):
-                    wall_key = tuple(sorted([(px_grid, pz_grid), (px_grid + PILLAR_SPACING, pz_grid)]))
-                    if wall_key in self.destroyed_walls:
-                        continue
-
-                    opening_type = self.get_doorway_type(px_grid, pz_grid, px_grid + PILLAR_SPACING, pz_grid)
-                    wall_z = pz_grid
-                    wall_x_start = px_grid
-                    wall_x_end = px_grid + PILLAR_SPACING
-
-                    if opening_type == "hallway":
-                        opening_width = HALLWAY_WIDTH
-                    elif opening_type == "doorway":
-                        opening_width = 60
-                    else:
-                        opening_width = 0
-
-                    if opening_width > 0:
-                        opening_start = wall_x_start + (PILLAR_SPACING - opening_width) / 2
-                        opening_end = opening_start + opening_width
-
-                        if abs(z - wall_z) < (half_thick + player_radius):
-                            if (wall_x_start <= x <= opening_start - player_radius) or \
-                                    (opening_end + player_radius <= x <= wall_x_end):
-                                return True
-                    else:
-                        if (wall_x_start - player_radius <= x <= wall_x_end + player_radius and
-                                abs(z - wall_z) < (half_thick + player_radius)):
-                            return True
-
-                # Check vertical wall
-                if self.has_wall_between(px_grid, pz_grid, px_grid, pz_grid + PILLAR_SPACING):
-                    wall_key = tuple(sorted([(px_grid, pz_grid), (px_grid, pz_grid + PILLAR_SPACING)]))
-                    if wall_key in self.destroyed_walls:
-                        continue
-
-                    opening_type = self.get_doorway_type(px_grid, pz_grid, px_grid, pz_grid + PILLAR_SPACING)
-                    wall_x = px_grid
-                    wall_z_start = pz_grid
-                    wall_z_end = pz_grid + PILLAR_SPACING
-
-                    if opening_type == "hallway":
-                        opening_width = HALLWAY_WIDTH
-                    elif opening_type == "doorway":
-                        opening_width = 60
-                    else:
-                        opening_width = 0
-
-                    if opening_width > 0:
-                        opening_start = wall_z_start + (PILLAR_SPACING - opening_width) / 2
-                        opening_end = opening_start + opening_width
-
-                        if abs(x - wall_x) < (half_thick + player_radius):
-                            if (wall_z_start <= z <= opening_start - player_radius) or \
-                                    (opening_end + player_radius <= z <= wall_z_end):
-                                return True
-                    else:
-                        if (wall_z_start - player_radius <= z <= wall_z_end + player_radius and
-                                abs(x - wall_x) < (half_thick + player_radius)):
-                            return True
-
-                # Check pillar collision
-                offset = PILLAR_SPACING // 2
-                pillar_x = px_grid + offset
-                pillar_z = pz_grid + offset
-                pillar_key = (pillar_x, pillar_z)
-                
-                if self.has_pillar_at(pillar_x, pillar_z) and pillar_key not in self.destroyed_pillars:
-                    pillar_min_x = pillar_x
-                    pillar_max_x = pillar_x + PILLAR_SIZE
-                    pillar_min_z = pillar_z
-                    pillar_max_z = pillar_z + PILLAR_SIZE
-
-                    closest_x = max(pillar_min_x, min(x, pillar_max_x))
-                    closest_z = max(pillar_min_z, min(z, pillar_max_z))
-
-                    dist_x = x - closest_x
-                    dist_z = z - closest_z
-                    dist_sq = dist_x * dist_x + dist_z * dist_z
-
-                    if dist_sq < player_radius * player_radius:
+        radius_sq = player_radius * player_radius
+
+        # The player is much smaller than a cell, so only the 3x3 block of
+        # cells around them can hold anything they touch
+        cell_x = int(x // PILLAR_SPACING)
+        cell_z = int(z // PILLAR_SPACING)
+        for gx in (cell_x - 1, cell_x, cell_x + 1):
+            for gz in (cell_z - 1, cell_z, cell_z + 1):
+                for x1, z1, x2, z2 in self.collision_segments(gx, gz):
+                    # Segments are axis-aligned, so the closest point is a clamp
+                    dist_x = x - max(min(x1, x2), min(x, max(x1, x2)))
+                    dist_z = z - max(min(z1, z2), min(z, max(z1, z2)))
+                    if dist_x * dist_x + dist_z * dist_z < radius_sq:
                         return True
 
         return False
 
     # === SAVE/LOAD ===
 
-    def get_state_for_save(self):
+    def get_state_for_save(self, packed=True):
         """
         Get complete world state for saving.
         
         IMPORTANT: Includes wall_cache and pillar_cache to preserve
         the exact map layout that was explored.
+
+        Array data is packed into raw bytes for binary formats; pass
+        packed=False for plain lists that stay readable in JSON.
         """
-        return {
+        state = {
             'seed': self.world_seed,
+            'doorway_rng': self.doorway_rng,
             
             # === MAP LAYOUT (NEW!) ===
-            'wall_cache': {str(k): v for k, v in self.wall_cache.items()},
-            'pillar_cache': {str(k): v for k, v in self.pillar_cache.items()},
+            # Coordinate arrays plus an exists mask, no per-entry objects
+            'wall_cache': self._pack_wall_cache(packed),
+            'pillar_cache': self._pack_pillar_cache(packed),
             
             # === DESTRUCTION STATE ===
-            'destroyed_walls': [list(wall) for wall in self.destroyed_walls],
-            'destroyed_pillars': [list(pillar) for pillar in self.destroyed_pillars],
-            'destroyed_lamps': [list(lamp) for lamp in self.destroyed_lamps],
-            'triggered_traps': [list(trap) for trap in self.triggered_traps],
+            # Packed coordinate rows, or wall/pillar keys as in version 1.1 for JSON
+            'destroyed_walls': _pack_rows(
+                [(x1, z1, x2, z2) for (x1, z1), (x2, z2) in map(_wall_from_code, self.destroyed_walls)], 4
+            ) if packed else list(self.destroyed_wall_keys()),
+            'destroyed_pillars': _pack_rows(
+                list(self.destroyed_pillars), 2
+            ) if packed else self.destroyed_pillars,
+            # Sets of tuples are serialized directly by the save encoder
+            'destroyed_lamps': self.destroyed_lamps,
+            'triggered_traps': self.triggered_traps,
             
             # === WALL DAMAGE ===
-            'wall_states': {str(k): v.name for k, v in self.wall_states.items()},
-            'wall_health': {str(k): v for k, v in self.wall_health.items()},
-            'wall_cracks': {str(k): v for k, v in self.wall_cracks.items()},
-            'pre_damaged_walls': {str(k): v for k, v in self.pre_damaged_walls.items()},
+            # Columns like the map layout, so loading needs no key parsing
+            'wall_states': _wall_columns(self.wall_states, 'state_id'),
+            # Health and cracks are saved as their quantized ints
+            'wall_health': _wall_columns(self.wall_health, 'health_q'),
+            'wall_cracks': _wall_columns(self.wall_cracks, 'cracks_q'),
+            # Floats rounded to SAVE_FLOAT_DIGITS - full repr precision is wasted bytes
+            'pre_damaged_walls': _wall_columns(
+                self.pre_damaged_walls, 'damage', lambda v: round(v, SAVE_FLOAT_DIGITS)
+            ),
             
             # === DEBRIS (limited to prevent huge files) ===
-            'debris_pieces': [
-                {
-                    'cx': d.cx, 'cy': d.cy, 'cz': d.cz,
-                    'color': d.color,
-                    'vx': d.vx, 'vy': d.vy, 'vz': d.vz,
-                    'is_settled': d.is_settled
-                }
-                for d in self.debris_pieces if d.active
-            ][:1000]  # Limit to 1000 most recent pieces
+            # One float32 row per piece (DEBRIS_SAVE_COLUMNS)
+            'debris_pieces_packed': self._pack_debris(MAX_SAVED_DEBRIS, packed)
+        }
+
+        # Entry counts, so save summaries never have to measure the data above
+        state['counts'] = {
+            'walls': len(self.wall_cache),
+            'pillars': len(self.pillar_cache),
+            'destroyed_walls': len(self.destroyed_walls),
+            'destroyed_pillars': len(self.destroyed_pillars),
+            'debris': min(len(self.debris), MAX_SAVED_DEBRIS)
+        }
+        return state
+
+    def _pack_debris(self, limit, packed=True):
+        """Pack up to limit active debris pieces into a float32 array, one DEBRIS_SAVE_COLUMNS row each."""
+        field = self.debris
+        live = field.live_indices()[:limit]
+        rows = np.empty((len(live), len(DEBRIS_SAVE_COLUMNS)), dtype=np.float32)
+        rows[:, _DEBRIS_POSITION] = np.column_stack((field.cx[live], field.cy[live], field.cz[live]))
+        rows[:, _DEBRIS_COLOR] = field.color[live]
+        rows[:, _DEBRIS_VELOCITY] = np.column_stack((field.vx[live], field.vy[live], field.vz[live]))
+        rows[:, _DEBRIS_SETTLED] = field.is_settled[live]
+        if not packed:
+            # float32 values print with float64 noise digits in JSON
+            return np.round(rows.astype(np.float64), SAVE_FLOAT_DIGITS).tolist()
+        return _pack_array(rows)
+
+    def _pack_wall_cache(self, packed=True):
+        """Pack wall_cache into an (N, 4) x1/z1/x2/z2 array and an exists mask."""
+        walls = [(x1, z1, x2, z2) for (x1, z1), (x2, z2) in map(_wall_from_code, self.wall_cache)]
+        exists = np.fromiter(self.wall_cache.values(), dtype=bool, count=len(self.wall_cache))
+        return {
+            'walls': _pack_rows(walls, 4, packed),
+            'exists': _pack_array(exists, packed)
+        }
+
+    def _pack_pillar_cache(self, packed=True):
+        """Pack pillar_cache into an (N, 2) x/z array and an exists mask."""
+        pillars = list(map(_pillar_from_code, self.pillar_cache))
+        exists = np.fromiter(self.pillar_cache.values(), dtype=bool, count=len(self.pillar_cache))
+        return {
+            'pillars': _pack_rows(pillars, 2, packed),
+            'exists': _pack_array(exists, packed)
         }
 
     def load_state(self, data):
@@ -584,26 +1041,54 @@ class World:
         the exact map layout.
         """
         self.world_seed = data.get('seed', self.world_seed)
+        self.doorway_rng = data.get('doorway_rng', DOORWAY_RNG_LEGACY)
+        self._wall_records = {}
+        self._collision_grid = {}
 
         # === LOAD MAP LAYOUT (NEW!) ===
         wall_cache_data = data.get('wall_cache', {})
-        self.wall_cache = {}
-        for k_str, v in wall_cache_data.items():
-            key = eval(k_str)  # Convert string back to tuple
-            self.wall_cache[key] = v
+        if 'walls' in wall_cache_data:
+            # Coordinate arrays (save version 1.2+)
+            x1, z1, x2, z2 = _unpack_array(wall_cache_data['walls'], 4).T.tolist()
+            exists = _unpack_array(wall_cache_data['exists']).tolist()
+            self.wall_cache = _rebuild_wall_cache(x1, z1, x2, z2, exists)
+        else:
+            self.wall_cache = CellBitset(layered=True)
+            for k_str, v in wall_cache_data.items():
+                (x1, z1), (x2, z2) = _parse_key(k_str)  # Convert string back to tuple
+                code = _wall_code(x1, z1, x2, z2)
+                if code is not None:
+                    self.wall_cache[code] = v
         
         pillar_cache_data = data.get('pillar_cache', {})
-        self.pillar_cache = {}
-        for k_str, v in pillar_cache_data.items():
-            key = eval(k_str)  # Convert string back to tuple
-            self.pillar_cache[key] = v
+        if 'pillars' in pillar_cache_data:
+            xs, zs = _unpack_array(pillar_cache_data['pillars'], 2).T.tolist()
+            exists = _unpack_array(pillar_cache_data['exists']).tolist()
+            self.pillar_cache = _rebuild_pillar_cache(xs, zs, exists)
+        else:
+            self.pillar_cache = CellBitset()
+            for k_str, v in pillar_cache_data.items():
+                code = _pillar_code(*_parse_key(k_str))  # Convert string back to tuple
+                if code is not None:
+                    self.pillar_cache[code] = v
         
         # === LOAD DESTRUCTION STATE ===
-        destroyed_walls_list = data.get('destroyed_walls', [])
-        self.destroyed_walls = {tuple(tuple(point) for point in wall) for wall in destroyed_walls_list}
+        destroyed_walls_data = data.get('destroyed_walls', [])
+        if isinstance(destroyed_walls_data, dict):
+            # Packed array (binary saves)
+            self.destroyed_walls = {
+                _wall_code(x1, z1, x2, z2)
+                for x1, z1, x2, z2 in _unpack_array(destroyed_walls_data).tolist()
+            }
+        else:
+            # Wall keys (JSON and version 1.1 saves)
+            self.destroyed_walls = {_wall_key_code(wall) for wall in destroyed_walls_data}
         
-        destroyed_pillars_list = data.get('destroyed_pillars', [])
-        self.destroyed_pillars = {tuple(pillar) for pillar in destroyed_pillars_list}
+        destroyed_pillars_data = data.get('destroyed_pillars', [])
+        if isinstance(destroyed_pillars_data, dict):
+            self.destroyed_pillars = set(map(tuple, _unpack_array(destroyed_pillars_data).tolist()))
+        else:
+            self.destroyed_pillars = {tuple(pillar) for pillar in destroyed_pillars_data}
         
         destroyed_lamps_list = data.get('destroyed_lamps', [])
         self.destroyed_lamps = {tuple(lamp) for lamp in destroyed_lamps_list}
@@ -613,31 +1098,57 @@ class World:
         
         # === LOAD WALL DAMAGE ===
         wall_states_data = data.get('wall_states', {})
-        self.wall_states = {}
-        for k_str, v_name in wall_states_data.items():
-            key = eval(k_str)
-            self.wall_states[key] = WallState[v_name]
+        if 'state_id' in wall_states_data:
+            self.wall_states = dict(_wall_entries(wall_states_data, 'state_id'))
+        else:
+            # State names keyed by str(wall_key) (save version 1.1)
+            self.wall_states = {
+                code: WallState[name].value
+                for code, name in _str_key_entries(wall_states_data)
+            }
         
         wall_health_data = data.get('wall_health', {})
-        self.wall_health = {eval(k): v for k, v in wall_health_data.items()}
+        if 'health_q' in wall_health_data:
+            self.wall_health = dict(_wall_entries(wall_health_data, 'health_q'))
+        else:
+            # Float health (save version 1.1)
+            self.wall_health = {
+                code: _quantize_health(health)
+                for code, health in _str_key_entries(wall_health_data)
+            }
         
         wall_cracks_data = data.get('wall_cracks', {})
-        self.wall_cracks = {eval(k): v for k, v in wall_cracks_data.items()}
+        if 'cracks_q' in wall_cracks_data:
+            self.wall_cracks = {
+                code: [tuple(crack) for crack in cracks]
+                for code, cracks in _wall_entries(wall_cracks_data, 'cracks_q')
+            }
+        else:
+            # Float cracks (save version 1.1)
+            self.wall_cracks = {
+                code: [_quantize_crack(*crack) for crack in cracks]
+                for code, cracks in _str_key_entries(wall_cracks_data)
+            }
         
         pre_damaged_data = data.get('pre_damaged_walls', {})
-        self.pre_damaged_walls = {eval(k): v for k, v in pre_damaged_data.items()}
+        self.pre_damaged_walls = dict(_wall_entries(pre_damaged_data, 'damage'))
         
         # === LOAD DEBRIS ===
+        self.debris.clear()
+        if 'debris_pieces_packed' in data:
+            rows = _unpack_array(data['debris_pieces_packed'], len(DEBRIS_SAVE_COLUMNS))
+            self.debris.spawn(rows[:, _DEBRIS_POSITION], rows[:, _DEBRIS_COLOR], rows[:, _DEBRIS_VELOCITY],
+                              settled=rows[:, _DEBRIS_SETTLED] != 0)
+
+        # Version 1.1 saves store one dict per piece
         debris_data = data.get('debris_pieces', [])
-        self.debris_pieces = []
-        for d_dict in debris_data:
-            velocity = (d_dict['vx'], d_dict['vy'], d_dict['vz']) if not d_dict.get('is_settled', False) else None
-            debris = Debris(
-                (d_dict['cx'], d_dict['cy'], d_dict['cz']),
-                tuple(d_dict['color']),
-                velocity=velocity
+        if debris_data:
+            self.debris.spawn(
+                [(d['cx'], d['cy'], d['cz']) for d in debris_data],
+                [d['color'] for d in debris_data],
+                [(d['vx'], d['vy'], d['vz']) for d in debris_data],
+                settled=[d.get('is_settled', False) for d in debris_data]
             )
-            self.debris_pieces.append(debris)
         
         # Clear only the zone cache (zones are always regenerated)
         self.zone_cache.clear()
@@ -647,4 +1158,4 @@ class World:
         print(f"Loaded {len(self.pillar_cache)} cached pillars")
         print(f"Loaded {len(self.destroyed_walls)} destroyed walls")
         print(f"Loaded {len(self.destroyed_pillars)} destroyed pillars")
-        print(f"Loaded {len(self.debris_pieces)} debris pieces")
+        print(f"Loaded {len(self.debris)} debris pieces")